@@ -1,21 +1,61 @@
 #!/usr/bin/env python3
 
+import sys
+
 from tree_sitter import Parser, Language
 import tree_sitter_markdown as tsmarkdown
 
-def print_node_types(node, content, level=0):
-    indent = "  " * level
-    print(f"{indent}Node type: {node.type}")
-    if node.type == 'list_item':
-        print(f"{indent}Content: {content[node.start_byte:node.end_byte]}")
-        print(f"{indent}Children types: {[c.type for c in node.children]}")
-        # Print the actual marker
-        marker = next((c for c in node.children if c.type in ['list_marker_dot', 'list_marker_minus']), None)
-        if marker:
-            print(f"{indent}Marker: '{content[marker.start_byte:marker.end_byte]}'")
-            print(f"{indent}Marker type: {marker.type}")
-    for child in node.children:
-        print_node_types(child, content, level + 1)
+# Indentation for each tree depth
+_INDENTS = tuple("  " * i for i in range(64))
+
+def print_node_types(tree, source, out):
+    """Print the node structure of a parsed tree.
+
+    The tree is walked with a TreeCursor rather than by recursing over
+    ``node.children``, so no child lists are materialized along the way.
+    Lines are passed to ``out`` (e.g. ``list.append``) so the caller can
+    write the whole report at once. ``source`` is the UTF-8 encoded document
+    the tree was parsed from, since node offsets are byte offsets.
+    """
+    cursor = tree.walk()
+    level = 0
+    while True:
+        node = cursor.node
+        node_type = node.type
+        indent = _INDENTS[level] if level < 64 else "  " * level
+        out(f"{indent}Node type: {node_type}\n")
+        if node_type == 'list_item':
+            out(f"{indent}Content: {source[node.start_byte:node.end_byte].decode('utf8')}\n")
+            # Collect the children with the same cursor, then step back up
+            child_types = []
+            marker = marker_type = None
+            if cursor.goto_first_child():
+                while True:
+                    child = cursor.node
+                    child_type = child.type
+                    child_types.append(child_type)
+                    if marker is None and child_type in ('list_marker_dot', 'list_marker_minus'):
+                        marker, marker_type = child, child_type
+                    if not cursor.goto_next_sibling():
+                        break
+                cursor.goto_parent()
+            out(f"{indent}Children types: {child_types}\n")
+            # Print the actual marker
+            if marker:
+                out(f"{indent}Marker: '{source[marker.start_byte:marker.end_byte].decode('utf8')}'\n")
+                out(f"{indent}Marker type: {marker_type}\n")
+
+        if cursor.goto_first_child():
+            level += 1
+            continue
+        if cursor.goto_next_sibling():
+            continue
+        while True:
+            if not cursor.goto_parent():
+                return
+            level -= 1
+            if cursor.goto_next_sibling():
+                break
 
 def main():
     # Create a simple markdown document with mixed lists
@@ -30,11 +70,14 @@ def main():
     parser.language = Language(tsmarkdown.language())
 
     # Parse the content
-    tree = parser.parse(bytes(content, "utf8"))
+    source = content.encode("utf8")
+    tree = parser.parse(source)
     print("Analyzing markdown document:")
     print(content)
     print("\nNode structure:")
-    print_node_types(tree.root_node, content)
+    buf = []
+    print_node_types(tree, source, buf.append)
+    sys.stdout.write("".join(buf))
 
 if __name__ == "__main__":
     main()
@@ -4,6 +4,17 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'active' command as (flags, add_argument options)
+_ACTIVE_ARGUMENTS = (
+    (("task_id",), {
+        "metavar": "TASK_ID",
+        "nargs": "?",
+        "help": _("Task ID to close tasks above (if not provided, lists all active tasks)"),
+    }),
+)
 
 
 def setup_active_parser(subparsers: Any) -> None:
@@ -12,18 +23,12 @@ def setup_active_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "active",
         help=_("Manage active tasks"),
-        description=_("List active tasks or close tasks above a specified task.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "task_id",
-        metavar="TASK_ID",
-        nargs="?",
-        help=_("Task ID to close tasks above (if not provided, lists all active tasks)")
+        description=_("List active tasks or close tasks above a specified task."),
+        arguments=_ACTIVE_ARGUMENTS
     )
 
 
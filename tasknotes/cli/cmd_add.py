@@ -4,6 +4,32 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'add' command as (flags, add_argument options)
+_ADD_ARGUMENTS = (
+    (("description",), {
+        "help": _("Task description"),
+    }),
+    (("--parent",), {
+        "metavar": "TASK_ID",
+        "help": _("Parent task ID to add this task to"),
+    }),
+    (("--yes", "-y"), {
+        "action": "store_true",
+        "help": _("Automatically confirm conversion if target is not a file-based task"),
+    }),
+    (("--tag", "-t"), {
+        "action": "append",
+        "metavar": "TAG",
+        "help": _("Tag to add to the task (can be specified multiple times)"),
+    }),
+    (("--file", "-f"), {
+        "metavar": "FILE",
+        "help": _("Read tasks from file, one per line. Use '-' for stdin"),
+    }),
+)
 
 
 def setup_add_parser(subparsers: Any) -> None:
@@ -12,41 +38,12 @@ def setup_add_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "add",
         help=_("Add a new task"),
-        description=_("Add a new task to the current active task.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "description",
-        help=_("Task description")
-    )
-    
-    parser.add_argument(
-        "--parent",
-        metavar="TASK_ID",
-        help=_("Parent task ID to add this task to")
-    )
-    
-    parser.add_argument(
-        "--yes", "-y",
-        action="store_true",
-        help=_("Automatically confirm conversion if target is not a file-based task")
-    )
-    
-    parser.add_argument(
-        "--tag", "-t",
-        action="append",
-        metavar="TAG",
-        help=_("Tag to add to the task (can be specified multiple times)")
-    )
-    
-    parser.add_argument(
-        "--file", "-f",
-        metavar="FILE",
-        help=_("Read tasks from file, one per line. Use '-' for stdin")
+        description=_("Add a new task to the current active task."),
+        arguments=_ADD_ARGUMENTS
     )
 
 
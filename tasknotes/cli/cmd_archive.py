@@ -4,6 +4,20 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'archive' command as (flags, add_argument options)
+_ARCHIVE_ARGUMENTS = (
+    (("task_id",), {
+        "metavar": "TASK_ID",
+        "help": _("Task ID to archive"),
+    }),
+    (("--yes", "-y"), {
+        "action": "store_true",
+        "help": _("Automatically confirm archiving incomplete tasks"),
+    }),
+)
 
 
 def setup_archive_parser(subparsers: Any) -> None:
@@ -12,23 +26,12 @@ def setup_archive_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "archive",
         help=_("Archive a task"),
-        description=_("Archive a task without changing associated note files.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "task_id",
-        metavar="TASK_ID",
-        help=_("Task ID to archive")
-    )
-    
-    parser.add_argument(
-        "--yes", "-y",
-        action="store_true",
-        help=_("Automatically confirm archiving incomplete tasks")
+        description=_("Archive a task without changing associated note files."),
+        arguments=_ARCHIVE_ARGUMENTS
     )
 
 
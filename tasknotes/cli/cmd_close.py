@@ -4,6 +4,21 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'close' command as (flags, add_argument options)
+_CLOSE_ARGUMENTS = (
+    (("task_id",), {
+        "metavar": "TASK_ID",
+        "nargs": "?",
+        "help": _("Task ID to close tasks above (if not provided, closes the most recent active task)"),
+    }),
+    (("--all",), {
+        "action": "store_true",
+        "help": _("Close all active tasks"),
+    }),
+)
 
 
 def setup_close_parser(subparsers: Any) -> None:
@@ -12,24 +27,12 @@ def setup_close_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "close",
         help=_("Close active tasks"),
-        description=_("Close the most recent active task or all tasks above a specified task.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "task_id",
-        metavar="TASK_ID",
-        nargs="?",
-        help=_("Task ID to close tasks above (if not provided, closes the most recent active task)")
-    )
-    
-    parser.add_argument(
-        "--all",
-        action="store_true",
-        help=_("Close all active tasks")
+        description=_("Close the most recent active task or all tasks above a specified task."),
+        arguments=_CLOSE_ARGUMENTS
     )
 
 
@@ -4,6 +4,17 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'done' command as (flags, add_argument options)
+_DONE_ARGUMENTS = (
+    (("task_id",), {
+        "metavar": "TASK_ID",
+        "nargs": "?",
+        "help": _("Task ID to mark as done (defaults to current active task)"),
+    }),
+)
 
 
 def setup_done_parser(subparsers: Any) -> None:
@@ -12,18 +23,12 @@ def setup_done_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "done",
         help=_("Mark a task as done"),
-        description=_("Mark a task as completed.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "task_id",
-        metavar="TASK_ID",
-        nargs="?",
-        help=_("Task ID to mark as done (defaults to current active task)")
+        description=_("Mark a task as completed."),
+        arguments=_DONE_ARGUMENTS
     )
 
 
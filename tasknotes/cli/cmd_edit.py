@@ -4,6 +4,16 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'edit' command as (flags, add_argument options)
+_EDIT_ARGUMENTS = (
+    (("task_id",), {
+        "metavar": "TASK_ID",
+        "help": _("Task ID to edit"),
+    }),
+)
 
 
 def setup_edit_parser(subparsers: Any) -> None:
@@ -12,17 +22,12 @@ def setup_edit_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "edit",
         help=_("Edit a task"),
-        description=_("Open the task in the default editor.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "task_id",
-        metavar="TASK_ID",
-        help=_("Task ID to edit")
+        description=_("Open the task in the default editor."),
+        arguments=_EDIT_ARGUMENTS
     )
 
 
@@ -4,6 +4,28 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'help' command as (flags, add_argument options)
+_HELP_ARGUMENTS = (
+    # Stored as 'topic' so it doesn't replace the 'command' the main parser
+    # stores the subcommand name in
+    (("topic",), {
+        "metavar": "command",
+        "nargs": "?",
+        "help": _("Command to show help for"),
+    }),
+    (("--all",), {
+        "action": "store_true",
+        "help": _("Show detailed help for all commands"),
+    }),
+    (("--format",), {
+        "choices": ["text", "markdown", "man"],
+        "default": "text",
+        "help": _("Output format (default: text)"),
+    }),
+)
 
 
 def setup_help_parser(subparsers: Any) -> None:
@@ -12,30 +34,12 @@ def setup_help_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "help",
         help=_("Show help information"),
-        description=_("Show help information for TaskNote commands.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "command",
-        nargs="?",
-        help=_("Command to show help for")
-    )
-    
-    parser.add_argument(
-        "--all",
-        action="store_true",
-        help=_("Show detailed help for all commands")
-    )
-    
-    parser.add_argument(
-        "--format",
-        choices=["text", "markdown", "man"],
-        default="text",
-        help=_("Output format (default: text)")
+        description=_("Show help information for TaskNote commands."),
+        arguments=_HELP_ARGUMENTS
     )
 
 
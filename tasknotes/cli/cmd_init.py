@@ -1,10 +1,24 @@
 """Command module for 'init' command."""
 
 import argparse
-from typing import Any
+import sys
+from typing import Any, TYPE_CHECKING
 
 from tasknotes.cli.i18n import _
-from tasknotes.cmds.base_cmd import CmdResult
+from tasknotes.cli.parser_spec import add_command_parser
+
+# Import CmdResult for type checking
+if TYPE_CHECKING:
+    from tasknotes.cmds.base_cmd import CmdResult
+
+
+# Arguments of the 'init' command as (flags, add_argument options)
+_INIT_ARGUMENTS = (
+    (("--git",), {
+        "action": "store_true",
+        "help": _("Use git backend for storing tasks"),
+    }),
+)
 
 
 def setup_init_parser(subparsers: Any) -> None:
@@ -13,21 +27,16 @@ def setup_init_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "init",
         help=_("Initialize a TaskNote repository"),
-        description=_("Initialize a new TaskNote repository in the current directory.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "--git",
-        action="store_true",
-        help=_("Use git backend for storing tasks")
+        description=_("Initialize a new TaskNote repository in the current directory."),
+        arguments=_INIT_ARGUMENTS
     )
 
 
-def format_init_result(result: CmdResult, console: Any, rich_available: bool) -> None:
+def format_init_result(result: 'CmdResult', console: Any, rich_available: bool) -> None:
     """Format the result of the init command.
     
     Args:
@@ -35,17 +44,20 @@ def format_init_result(result: CmdResult, console: Any, rich_available: bool) ->
         console: The console to print to
         rich_available: Whether Rich is available for enhanced output
     """
+    already_initialized = result.data.get("already_initialized", False)
+    
     if rich_available:
-        # Rich formatting with colors
-        if result.data.get("already_initialized", False):
-            console.print(f"[yellow]{result.message}[/yellow]")
-        else:
-            console.print(f"[green]{result.message}[/green]")
+        # Rich formatting with colors, passed as a Text so Rich does not
+        # parse the message as markup
+        from rich.text import Text
+        style = "yellow" if already_initialized else "green"
+        console.print(Text(result.message, style=style))
     else:
-        # Standard output without colors
-        print(result.message)
-        if not result.data.get("already_initialized", False):
-            print(f"Repository path: {result.data.get('path', '')}")
+        # Standard output without colors, written in one call
+        lines = [result.message]
+        if not already_initialized:
+            lines.append(f"Repository path: {result.data.get('path', '')}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # The _ function is imported from i18n module
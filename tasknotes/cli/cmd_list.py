@@ -1,10 +1,60 @@
 """Command module for 'list' command."""
 
 import argparse
-from typing import Any
+from typing import Any, Dict, List, Sequence, Tuple, TYPE_CHECKING
 
 from tasknotes.cli.i18n import _
-from tasknotes.cmds.base_cmd import CmdResult
+from tasknotes.cli.output import write_text
+from tasknotes.cli.parser_spec import add_command_parser
+
+# Import CmdResult for type checking
+if TYPE_CHECKING:
+    from tasknotes.cmds.base_cmd import CmdResult
+
+# Row format for the plain text task table
+_ROW_FMT = "{:<10} {:<30} {:<10} {:<20}\n"
+
+# rich.table.Table, imported on the first Rich formatted result so that
+# plain text output never imports Rich
+_Table = None
+
+
+def _task_columns(tasks: List[Dict[str, Any]]) -> Tuple[Sequence[str], ...]:
+    """Transpose the task rows into ID, title, status and tags columns.
+    
+    Args:
+        tasks: The task dictionaries from the command result
+        
+    Returns:
+        Tuple[Sequence[str], ...]: The four columns, with each task's tags joined by ", "
+    """
+    rows = [
+        (task.get("id", ""), task.get("title", ""), task.get("status", ""), ", ".join(task.get("tags", ())))
+        for task in tasks
+    ]
+    return tuple(zip(*rows)) if rows else ((), (), (), ())
+
+
+# Arguments of the 'list' command as (flags, add_argument options)
+_LIST_ARGUMENTS = (
+    (("task_ids",), {
+        "metavar": "TASK_ID",
+        "nargs": "*",
+        "help": _("Task IDs or 'active' keyword to list tasks (defaults to current active task)"),
+    }),
+    # Note: The 'active' keyword is handled as a special case in the task_ids argument
+    # We'll check for it in the implementation
+    (("--tag", "-t"), {
+        "metavar": "TAG",
+        "help": _("Filter tasks by tag"),
+    }),
+    (("--all",), {
+        "action": "store_true",
+        "help": _("Include archived tasks in the results"),
+    }),
+    # Handle the tag_group case
+    # This is a bit tricky as it overlaps with task_ids, but we'll handle it in the implementation
+)
 
 
 def setup_list_parser(subparsers: Any) -> None:
@@ -13,40 +63,16 @@ def setup_list_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "list",
         help=_("List tasks"),
-        description=_("List tasks with optional filtering.")
+        description=_("List tasks with optional filtering."),
+        arguments=_LIST_ARGUMENTS
     )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "task_ids",
-        metavar="TASK_ID",
-        nargs="*",
-        help=_("Task IDs or 'active' keyword to list tasks (defaults to current active task)")
-    )
-    
-    # Note: The 'active' keyword is handled as a special case in the task_ids argument
-    # We'll check for it in the implementation
-    
-    parser.add_argument(
-        "--tag", "-t",
-        metavar="TAG",
-        help=_("Filter tasks by tag")
-    )
-    
-    parser.add_argument(
-        "--all",
-        action="store_true",
-        help=_("Include archived tasks in the results")
-    )
-    
-    # Handle the tag_group case
-    # This is a bit tricky as it overlaps with task_ids, but we'll handle it in the implementation
 
 
-def format_list_result(result: CmdResult, console: Any, rich_available: bool) -> None:
+def format_list_result(result: 'CmdResult', console: Any, rich_available: bool) -> None:
     """Format the result of the list command.
     
     Args:
@@ -54,38 +80,33 @@ def format_list_result(result: CmdResult, console: Any, rich_available: bool) ->
         console: The console to print to
         rich_available: Whether Rich is available for enhanced output
     """
+    columns = _task_columns(result.data.get("tasks") or [])
+    
     if rich_available:
         # Rich table output
-        from rich.table import Table
+        global _Table
+        if _Table is None:
+            from rich.table import Table as _Table
         
-        table = Table(title=result.message)
+        table = _Table(title=result.message)
         table.add_column("ID", style="cyan")
         table.add_column("Title", style="green")
         table.add_column("Status", style="magenta")
         table.add_column("Tags", style="yellow")
         
-        for task in result.data.get("tasks", []):
-            table.add_row(
-                task.get("id", ""),
-                task.get("title", ""),
-                task.get("status", ""),
-                ", ".join(task.get("tags", []))
-            )
+        for row in zip(*columns):
+            table.add_row(*row)
         
         console.print(table)
     else:
-        # Standard table output using plain text
-        print(result.message)
-        print(f"{'ID':<10} {'Title':<30} {'Status':<10} {'Tags':<20}")
-        print("-" * 70)
-        
-        for task in result.data.get("tasks", []):
-            print(
-                f"{task.get('id', ''):<10} "
-                f"{task.get('title', ''):<30} "
-                f"{task.get('status', ''):<10} "
-                f"{', '.join(task.get('tags', [])):<20}"
-            )
+        # Standard table output using plain text, written in one call
+        lines = [
+            result.message + "\n",
+            _ROW_FMT.format("ID", "Title", "Status", "Tags"),
+            "-" * 70 + "\n",
+        ]
+        lines.extend(map(_ROW_FMT.format, *columns))
+        write_text("".join(lines))
 
 
 # The _ function is imported from i18n module
@@ -4,6 +4,25 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'mcp' command as (flags, add_argument options)
+_MCP_ARGUMENTS = (
+    (("--port",), {
+        "type": int,
+        "default": 8080,
+        "help": _("Server port (default: 8080)"),
+    }),
+    (("--host",), {
+        "default": "127.0.0.1",
+        "help": _("Server host (default: 127.0.0.1)"),
+    }),
+    (("--auth",), {
+        "metavar": "TOKEN",
+        "help": _("Authentication token for API requests"),
+    }),
+)
 
 
 def setup_mcp_parser(subparsers: Any) -> None:
@@ -12,30 +31,12 @@ def setup_mcp_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "mcp",
         help=_("Start MCP server"),
-        description=_("Start a Machine Communication Protocol server for LLM API access.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "--port",
-        type=int,
-        default=8080,
-        help=_("Server port (default: 8080)")
-    )
-    
-    parser.add_argument(
-        "--host",
-        default="127.0.0.1",
-        help=_("Server host (default: 127.0.0.1)")
-    )
-    
-    parser.add_argument(
-        "--auth",
-        metavar="TOKEN",
-        help=_("Authentication token for API requests")
+        description=_("Start a Machine Communication Protocol server for LLM API access."),
+        arguments=_MCP_ARGUMENTS
     )
 
 
@@ -4,6 +4,30 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'note' command as (flags, add_argument options)
+_NOTE_ARGUMENTS = (
+    (("--task",), {
+        "metavar": "TASK_ID",
+        "help": _("Task ID to add notes to (defaults to current active task)"),
+    }),
+    (("--category", "-c"), {
+        "metavar": "CATEGORY",
+        "default": "notes",
+        "help": _("Note category (defaults to 'notes')"),
+    }),
+    (("--message", "-m"), {
+        "action": "append",
+        "metavar": "MESSAGE",
+        "help": _("Note content (can be specified multiple times for multi-line notes)"),
+    }),
+    (("--file", "-f"), {
+        "metavar": "FILE",
+        "help": _("Read note content from file"),
+    }),
+)
 
 
 def setup_note_parser(subparsers: Any) -> None:
@@ -12,37 +36,12 @@ def setup_note_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "note",
         help=_("Add notes to a task"),
-        description=_("Add or edit notes for a specific task.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "--task",
-        metavar="TASK_ID",
-        help=_("Task ID to add notes to (defaults to current active task)")
-    )
-    
-    parser.add_argument(
-        "--category", "-c",
-        metavar="CATEGORY",
-        default="notes",
-        help=_("Note category (defaults to 'notes')")
-    )
-    
-    parser.add_argument(
-        "--message", "-m",
-        action="append",
-        metavar="MESSAGE",
-        help=_("Note content (can be specified multiple times for multi-line notes)")
-    )
-    
-    parser.add_argument(
-        "--file", "-f",
-        metavar="FILE",
-        help=_("Read note content from file")
+        description=_("Add or edit notes for a specific task."),
+        arguments=_NOTE_ARGUMENTS
     )
 
 
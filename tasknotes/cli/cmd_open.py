@@ -4,6 +4,16 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'open' command as (flags, add_argument options)
+_OPEN_ARGUMENTS = (
+    (("task_id",), {
+        "metavar": "TASK_ID",
+        "help": _("Task ID to open as active"),
+    }),
+)
 
 
 def setup_open_parser(subparsers: Any) -> None:
@@ -12,17 +22,12 @@ def setup_open_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "open",
         help=_("Open a task as active"),
-        description=_("Set a task as the active task.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "task_id",
-        metavar="TASK_ID",
-        help=_("Task ID to open as active")
+        description=_("Set a task as the active task."),
+        arguments=_OPEN_ARGUMENTS
     )
 
 
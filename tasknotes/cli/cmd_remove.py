@@ -4,6 +4,24 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'remove' command as (flags, add_argument options)
+_REMOVE_ARGUMENTS = (
+    (("task_id",), {
+        "metavar": "TASK_ID",
+        "help": _("Task ID to remove"),
+    }),
+    (("--force",), {
+        "action": "store_true",
+        "help": _("Force removal even if task has notes or subtasks"),
+    }),
+    (("--yes", "-y"), {
+        "action": "store_true",
+        "help": _("Automatically confirm removal without prompting"),
+    }),
+)
 
 
 def setup_remove_parser(subparsers: Any) -> None:
@@ -12,29 +30,12 @@ def setup_remove_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "remove",
         help=_("Remove a task"),
-        description=_("Remove a task and its associated notes.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "task_id",
-        metavar="TASK_ID",
-        help=_("Task ID to remove")
-    )
-    
-    parser.add_argument(
-        "--force",
-        action="store_true",
-        help=_("Force removal even if task has notes or subtasks")
-    )
-    
-    parser.add_argument(
-        "--yes", "-y",
-        action="store_true",
-        help=_("Automatically confirm removal without prompting")
+        description=_("Remove a task and its associated notes."),
+        arguments=_REMOVE_ARGUMENTS
     )
 
 
@@ -1,10 +1,70 @@
 """Command module for 'search' command."""
 
 import argparse
-from typing import Any
+from typing import Any, Dict, List, Sequence, Tuple, TYPE_CHECKING
 
 from tasknotes.cli.i18n import _
-from tasknotes.cmds.base_cmd import CmdResult
+from tasknotes.cli.output import write_text
+from tasknotes.cli.parser_spec import add_command_parser
+
+# Import CmdResult for type checking
+if TYPE_CHECKING:
+    from tasknotes.cmds.base_cmd import CmdResult
+
+# Row formats for the plain text task and note tables
+_TASK_ROW_FMT = "{:<10} {:<30} {:<10}\n"
+_NOTE_ROW_FMT = "{:<10} {:<15} {:<40}\n"
+
+# rich.table.Table, imported on the first Rich formatted result so that
+# plain text output never imports Rich
+_Table = None
+
+
+def _task_columns(tasks: List[Dict[str, Any]]) -> Tuple[Sequence[str], ...]:
+    """Transpose the task rows into ID, title and status columns.
+    
+    Args:
+        tasks: The task dictionaries from the command result
+        
+    Returns:
+        Tuple[Sequence[str], ...]: The three columns
+    """
+    rows = [(task.get("id", ""), task.get("title", ""), task.get("status", "")) for task in tasks]
+    return tuple(zip(*rows)) if rows else ((), (), ())
+
+
+def _note_columns(notes: List[Dict[str, Any]]) -> Tuple[Sequence[str], ...]:
+    """Transpose the note rows into task ID, category and content columns.
+    
+    Args:
+        notes: The note dictionaries from the command result
+        
+    Returns:
+        Tuple[Sequence[str], ...]: The three columns
+    """
+    rows = [(note.get("task_id", ""), note.get("category", ""), note.get("content", "")) for note in notes]
+    return tuple(zip(*rows)) if rows else ((), (), ())
+
+
+# Arguments of the 'search' command as (flags, add_argument options)
+_SEARCH_ARGUMENTS = (
+    (("query",), {
+        "help": _("Search query"),
+    }),
+    (("--tag", "-t"), {
+        "metavar": "TAG",
+        "help": _("Filter results by tag"),
+    }),
+    (("--in",), {
+        "dest": "in_task",
+        "metavar": "TASK_ID",
+        "help": _("Search only within the specified task and its subtasks"),
+    }),
+    (("--all",), {
+        "action": "store_true",
+        "help": _("Include archived tasks in the search results"),
+    }),
+)
 
 
 def setup_search_parser(subparsers: Any) -> None:
@@ -13,39 +73,16 @@ def setup_search_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "search",
         help=_("Search for tasks"),
-        description=_("Search for tasks and notes matching the query.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "query",
-        help=_("Search query")
-    )
-    
-    parser.add_argument(
-        "--tag", "-t",
-        metavar="TAG",
-        help=_("Filter results by tag")
-    )
-    
-    parser.add_argument(
-        "--in",
-        dest="in_task",
-        metavar="TASK_ID",
-        help=_("Search only within the specified task and its subtasks")
-    )
-    
-    parser.add_argument(
-        "--all",
-        action="store_true",
-        help=_("Include archived tasks in the search results")
+        description=_("Search for tasks and notes matching the query."),
+        arguments=_SEARCH_ARGUMENTS
     )
 
 
-def format_search_result(result: CmdResult, console: Any, rich_available: bool) -> None:
+def format_search_result(result: 'CmdResult', console: Any, rich_available: bool) -> None:
     """Format the result of the search command.
     
     Args:
@@ -53,72 +90,63 @@ def format_search_result(result: CmdResult, console: Any, rich_available: bool)
         console: The console to print to
         rich_available: Whether Rich is available for enhanced output
     """
+    tasks = result.data.get("tasks") or []
+    notes = result.data.get("notes") or []
+    task_columns = _task_columns(tasks)
+    note_columns = _note_columns(notes)
+    
     if rich_available:
         # Rich formatting with tables
-        from rich.table import Table
+        global _Table
+        if _Table is None:
+            from rich.table import Table as _Table
         
-        console.print(f"[green]{result.message}[/green]")
+        # Pass a Text so Rich does not parse the message as markup
+        from rich.text import Text
+        console.print(Text(result.message, style="green"))
         
         # Show tasks in a table
-        if result.data.get("tasks"):
-            task_table = Table(title="Matching Tasks")
+        if tasks:
+            task_table = _Table(title="Matching Tasks")
             task_table.add_column("ID", style="cyan")
             task_table.add_column("Title", style="green")
             task_table.add_column("Status", style="magenta")
             
-            for task in result.data.get("tasks", []):
-                task_table.add_row(
-                    task.get("id", ""),
-                    task.get("title", ""),
-                    task.get("status", "")
-                )
+            for row in zip(*task_columns):
+                task_table.add_row(*row)
             
             console.print(task_table)
         
         # Show notes in a separate table
-        if result.data.get("notes"):
-            note_table = Table(title="Matching Notes")
+        if notes:
+            note_table = _Table(title="Matching Notes")
             note_table.add_column("Task ID", style="cyan")
             note_table.add_column("Category", style="magenta")
             note_table.add_column("Content", style="green")
             
-            for note in result.data.get("notes", []):
-                note_table.add_row(
-                    note.get("task_id", ""),
-                    note.get("category", ""),
-                    note.get("content", "")
-                )
+            for row in zip(*note_columns):
+                note_table.add_row(*row)
             
             console.print(note_table)
     else:
-        # Standard output with plain text tables
-        print(result.message)
+        # Standard output with plain text tables, written in one call
+        lines = [result.message + "\n"]
         
         # Show tasks
-        if result.data.get("tasks"):
-            print("\nMatching Tasks:")
-            print(f"{'ID':<10} {'Title':<30} {'Status':<10}")
-            print("-" * 50)
-            
-            for task in result.data.get("tasks", []):
-                print(
-                    f"{task.get('id', ''):<10} "
-                    f"{task.get('title', ''):<30} "
-                    f"{task.get('status', ''):<10}"
-                )
+        if tasks:
+            lines.append("\nMatching Tasks:\n")
+            lines.append(_TASK_ROW_FMT.format("ID", "Title", "Status"))
+            lines.append("-" * 50 + "\n")
+            lines.extend(map(_TASK_ROW_FMT.format, *task_columns))
         
         # Show notes
-        if result.data.get("notes"):
-            print("\nMatching Notes:")
-            print(f"{'Task ID':<10} {'Category':<15} {'Content':<40}")
-            print("-" * 65)
-            
-            for note in result.data.get("notes", []):
-                print(
-                    f"{note.get('task_id', ''):<10} "
-                    f"{note.get('category', ''):<15} "
-                    f"{note.get('content', ''):<40}"
-                )
+        if notes:
+            lines.append("\nMatching Notes:\n")
+            lines.append(_NOTE_ROW_FMT.format("Task ID", "Category", "Content"))
+            lines.append("-" * 65 + "\n")
+            lines.extend(map(_NOTE_ROW_FMT.format, *note_columns))
+        
+        write_text("".join(lines))
 
 
 # The _ function is imported from i18n module
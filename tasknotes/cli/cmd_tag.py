@@ -4,6 +4,34 @@ import argparse
 from typing import Any
 
 from tasknotes.cli.i18n import _
+from tasknotes.cli.parser_spec import add_command_parser
+
+
+# Arguments of the 'tag' command as (flags, add_argument options)
+_TAG_ARGUMENTS = (
+    (("task_id",), {
+        "metavar": "TASK_ID",
+        "nargs": "?",
+        "help": _("Task ID to manage tags for (defaults to current active task)"),
+    }),
+    (("--tag", "-t"), {
+        "action": "append",
+        "metavar": "TAG",
+        "help": _("Tag to add to the task (can be specified multiple times)"),
+    }),
+    (("--replace",), {
+        "action": "store_true",
+        "help": _("Replace existing tags instead of adding to them"),
+    }),
+    (("--group", "-g"), {
+        "metavar": "GROUP",
+        "help": _("Tag group to add tags to or list tags from"),
+    }),
+    (("--ordered", "-o"), {
+        "action": "store_true",
+        "help": _("Mark the tag group as ordered (default is unordered)"),
+    }),
+)
 
 
 def setup_tag_parser(subparsers: Any) -> None:
@@ -12,43 +40,12 @@ def setup_tag_parser(subparsers: Any) -> None:
     Args:
         subparsers: The subparsers object from the main parser
     """
-    parser = subparsers.add_parser(
+    add_command_parser(
+        subparsers,
         "tag",
         help=_("Manage task tags"),
-        description=_("Add, list, or replace tags for a task.")
-    )
-    
-    # Add command-specific arguments
-    parser.add_argument(
-        "task_id",
-        metavar="TASK_ID",
-        nargs="?",
-        help=_("Task ID to manage tags for (defaults to current active task)")
-    )
-    
-    parser.add_argument(
-        "--tag", "-t",
-        action="append",
-        metavar="TAG",
-        help=_("Tag to add to the task (can be specified multiple times)")
-    )
-    
-    parser.add_argument(
-        "--replace",
-        action="store_true",
-        help=_("Replace existing tags instead of adding to them")
-    )
-    
-    parser.add_argument(
-        "--group", "-g",
-        metavar="GROUP",
-        help=_("Tag group to add tags to or list tags from")
-    )
-    
-    parser.add_argument(
-        "--ordered", "-o",
-        action="store_true",
-        help=_("Mark the tag group as ordered (default is unordered)")
+        description=_("Add, list, or replace tags for a task."),
+        arguments=_TAG_ARGUMENTS
     )
 
 
@@ -0,0 +1,254 @@
+"""Optional daemon mode for the TaskNotes CLI.
+
+The daemon is a long-lived process that runs CLI invocations on behalf of
+short-lived clients, so warm invocations skip interpreter startup and module
+imports. Start it with::
+
+    python -m tasknotes.cli.daemon /path/to/socket
+
+and set ``TASKNOTE_DAEMON=/path/to/socket`` for the CLI to forward its
+arguments to it. If the socket cannot be reached, the CLI runs locally.
+
+Each request is a single JSON line ``{"argv": [...], "cwd": "...", "env": {...}}``
+and each response a single JSON line
+``{"stdout": "...", "stderr": "...", "exit_code": 0}``. Requests are handled one
+at a time. The client's TASKNOTE_* environment variables are applied for the
+duration of each request. The TaskNoteEnv of each working directory is kept
+between requests, so its git repository is opened only once.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
+
+# Import TaskNoteEnv for type checking
+if TYPE_CHECKING:
+    from tasknotes.core.task_env import TaskNoteEnv
+
+# Environment variable naming the daemon socket
+DAEMON_ENV = "TASKNOTE_DAEMON"
+
+# Prefix of the environment variables forwarded to the daemon
+FORWARDED_ENV_PREFIX = "TASKNOTE_"
+
+# Task environments of the directories served so far, keyed by resolved path
+_task_envs: Dict[str, 'TaskNoteEnv'] = {}
+
+
+def forwarded_env() -> Dict[str, str]:
+    """Get the environment variables of this process to forward to the daemon.
+
+    Returns:
+        Dict[str, str]: The TASKNOTE_* variables, except the daemon socket
+    """
+    return {
+        name: value for name, value in os.environ.items()
+        if name.startswith(FORWARDED_ENV_PREFIX) and name != DAEMON_ENV
+    }
+
+
+def _reload_env_settings() -> None:
+    """Reload the settings read from the environment by the CLI and config."""
+    from tasknotes.cli.main import load_env_settings
+    from tasknotes.core.config import config
+
+    load_env_settings()
+    config.reload()
+
+
+@contextlib.contextmanager
+def _client_env(env: Dict[str, str]) -> Iterator[None]:
+    """Replace the TASKNOTE_* environment variables with the client's.
+
+    Args:
+        env: The environment variables forwarded by the client
+    """
+    saved = forwarded_env()
+    for name in saved:
+        del os.environ[name]
+    os.environ.update(
+        (name, value) for name, value in env.items()
+        if name.startswith(FORWARDED_ENV_PREFIX) and name != DAEMON_ENV
+    )
+    _reload_env_settings()
+    try:
+        yield
+    finally:
+        for name in forwarded_env():
+            del os.environ[name]
+        os.environ.update(saved)
+        _reload_env_settings()
+
+
+def _get_task_env(cwd: str) -> 'TaskNoteEnv':
+    """Get the task environment for a directory, reusing the one of an earlier request.
+
+    Other processes may have changed the repository since the last request,
+    so the cached mode is dropped, and a directory that was not a git
+    repository is probed again.
+
+    Args:
+        cwd: The working directory of the client
+
+    Returns:
+        TaskNoteEnv: The task environment for the directory
+    """
+    from tasknotes.core.task_env import TaskNoteEnv
+
+    path = os.path.realpath(cwd)
+    task_env = _task_envs.get(path)
+    if task_env is None or not task_env.is_git_repo():
+        task_env = _task_envs[path] = TaskNoteEnv(path)
+    else:
+        task_env.__dict__.pop("mode", None)
+    return task_env
+
+
+def run_invocation(argv: List[str], cwd: str, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Run one CLI invocation in this process and capture its output.
+
+    An exception raised by the invocation is reported in the captured stderr
+    with exit code 1, so the client doesn't run the command again locally.
+
+    Args:
+        argv: The command line arguments without the program name
+        cwd: The working directory of the client
+        env: The TASKNOTE_* environment variables of the client
+
+    Returns:
+        Dict[str, Any]: The captured stdout and stderr and the exit code
+    """
+    from tasknotes.cli.main import main
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    saved_stdin, saved_cwd = sys.stdin, os.getcwd()
+    try:
+        os.chdir(cwd)
+        # stdin is not forwarded, see should_forward()
+        sys.stdin = io.StringIO()
+        with _client_env(env or {}), \
+                contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                main(argv, _get_task_env(cwd))
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    exit_code = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.stdin = saved_stdin
+        os.chdir(saved_cwd)
+
+    return {
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "exit_code": exit_code
+    }
+
+
+class _InvocationHandler(socketserver.StreamRequestHandler):
+    """Handle a single forwarded CLI invocation."""
+
+    def handle(self) -> None:
+        request = json.loads(self.rfile.readline())
+        response = run_invocation(request["argv"], request["cwd"], request.get("env"))
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def serve(socket_path: str) -> None:
+    """Serve CLI invocations on a Unix socket until interrupted.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on
+    """
+    # Never forward invocations from the daemon itself
+    os.environ.pop(DAEMON_ENV, None)
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    # Create the socket accessible to the owner only from the start
+    saved_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(socket_path, _InvocationHandler)
+    finally:
+        os.umask(saved_umask)
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def should_forward(argv: List[str]) -> bool:
+    """Check whether an invocation can be run by the daemon.
+
+    Invocations reading from stdin ('-f -') always run locally, because
+    stdin is not forwarded to the daemon.
+
+    Args:
+        argv: The command line arguments without the program name
+
+    Returns:
+        bool: True if the invocation can be forwarded
+    """
+    return "-" not in argv
+
+
+def forward(socket_path: str, argv: List[str]) -> Optional[int]:
+    """Forward a CLI invocation to the daemon and replay its output.
+
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        argv: The command line arguments without the program name
+
+    Returns:
+        Optional[int]: The exit code of the invocation, or None if the
+        daemon could not be reached
+
+    Once connected, the invocation may already have run in the daemon, so a
+    failure to send the request or read the reply is reported with exit code
+    1 instead of returning None, which would run it again locally.
+    """
+    request = json.dumps({
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": forwarded_env()
+    }).encode("utf-8") + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return None
+        try:
+            sock.sendall(request)
+            with sock.makefile("rb") as reply:
+                response = json.loads(reply.readline())
+        except (OSError, ValueError) as e:
+            print(f"Error: no reply from the TaskNotes daemon: {e}", file=sys.stderr)
+            return 1
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["exit_code"]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m tasknotes.cli.daemon SOCKET_PATH", file=sys.stderr)
+        sys.exit(2)
+    serve(sys.argv[1])
@@ -1,33 +1,51 @@
 """Internationalization support for TaskNote CLI."""
 
-from typing import Any
-
-
-def _(*args: Any, **kwargs: Any) -> str:
-    """Placeholder for internationalization.
-    
-    This function serves as a placeholder for gettext translation function.
-    In a real implementation, this would be replaced with gettext.
-    
-    Args:
-        *args: Variable length argument list
-        **kwargs: Arbitrary keyword arguments
-    
-    Returns:
-        str: The original string, unchanged
-    """
-    if args:
-        return args[0]
-    return ""
-
-
-# In the future, this would be implemented with gettext:
-# 
-# import gettext
-# import os
-# 
-# # Set up gettext for internationalization
-# localedir = os.path.join(os.path.dirname(__file__), '..', 'locale')
-# gettext.bindtextdomain('tasknote', localedir)
-# gettext.textdomain('tasknote')
-# _ = gettext.gettext
+import gettext
+import os
+import sys
+from typing import Dict
+
+# Set up gettext for internationalization
+localedir = os.path.join(os.path.dirname(__file__), '..', 'locale')
+
+# Translated messages, keyed by msgid
+_cache: Dict[str, str] = {}
+
+
+if gettext.find('tasknote', localedir) is None:
+    # No catalog for the languages requested through LANGUAGE, LC_ALL,
+    # LC_MESSAGES or LANG (e.g. the C, POSIX or English locales), so every
+    # message is its own translation.
+    def _(message: str) -> str:
+        """Translate a message.
+
+        The message is interned, as translations are below, so parsers that
+        share a help string also share a single string object.
+
+        Args:
+            message: The message to translate
+
+        Returns:
+            str: The original message, interned
+        """
+        return sys.intern(message)
+else:
+    def _(message: str, _cache: Dict[str, str] = _cache,
+          _gettext=gettext.translation('tasknote', localedir).gettext) -> str:
+        """Translate a message.
+
+        The parser setup functions translate the same constant help strings on
+        every run, so each msgid is looked up in the catalog only once and then
+        served from a module-level cache. Translations are interned so parsers
+        that share a help string also share a single string object.
+
+        Args:
+            message: The message to translate
+
+        Returns:
+            str: The translated message, or the original message if no translation exists
+        """
+        translated = _cache.get(message)
+        if translated is None:
+            translated = _cache[message] = sys.intern(_gettext(message))
+        return translated
@@ -1,48 +1,85 @@
 """Main entry point for TaskNotes CLI."""
 
 import argparse
-import json
+import functools
+import importlib
 import os
+import re
 import sys
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Iterable, List, Optional, Callable, Tuple, TYPE_CHECKING
 
-# Check if Rich should be disabled via environment variable
-RICH_DISABLED = os.environ.get("TASKNOTE_NO_RICH", "").lower() in ("1", "true", "yes")
+# Import TaskNoteEnv for type checking
+if TYPE_CHECKING:
+    from tasknotes.core.task_env import TaskNoteEnv
 
-# Try to import Rich for enhanced output, but make it optional
-if not RICH_DISABLED:
-    try:
-        from rich.console import Console
-        from rich.table import Table
-        from rich.panel import Panel
-        from rich.text import Text
-        RICH_AVAILABLE = True
-    except ImportError:
-        RICH_AVAILABLE = False
-else:
-    RICH_AVAILABLE = False
+# Whether Rich is disabled and debug mode is enabled, read from the
+# environment by load_env_settings()
+RICH_DISABLED = False
+DEBUG_MODE = False
+
+# Whether Rich is used for output. Rich is imported by get_console() on
+# first use, so --help, --version and argument errors never load it.
+RICH_AVAILABLE = False
 
 from tasknotes.cli.i18n import _
-from tasknotes.cmds.base_cmd import BaseCmd
-from tasknotes.cmds.cmd_service import CmdService
-from tasknotes.cmds.cmd_factory import cmd_factory, register_all_commands
-from tasknotes.core.task_env import TaskNoteEnv, find_file_service
-
-# Create a console for output (rich if available, otherwise standard)
-if RICH_AVAILABLE:
-    console = Console()
-else:
-    # Create a simple console wrapper with similar interface
-    class SimpleConsole:
-        def print(self, *args, file=None, **kwargs):
-            # Strip any rich formatting markers
-            text = str(args[0])
-            # Simple regex to remove rich formatting tags like [green] or [bold red]
-            import re
-            text = re.sub(r'\[([^\]]+)\]', '', text)
-            print(text, file=file)
-    
-    console = SimpleConsole()
+
+# Rich formatting tags like [green] or [bold red]
+_RICH_TAG_RE = re.compile(r'\[([^\]]+)\]')
+
+
+class SimpleConsole:
+    """Console wrapper with a Rich-like interface for plain text output."""
+    
+    def print(self, *args, file=None, **kwargs):
+        # Join the objects like Rich does
+        text = " ".join([arg if isinstance(arg, str) else str(arg) for arg in args])
+        # Strip any rich formatting markers
+        if "[" in text:
+            text = _RICH_TAG_RE.sub('', text)
+        print(text, file=file)
+
+
+# Console for output, created by get_console()
+console = None
+
+
+def get_console() -> Any:
+    """Get the console for output, creating it on first use.
+    
+    Returns:
+        Any: A Rich console if Rich is available and not disabled,
+        otherwise a SimpleConsole
+    """
+    global console, RICH_AVAILABLE
+    if console is None:
+        # Try to import Rich for enhanced output, but make it optional
+        RICH_AVAILABLE = False
+        if not RICH_DISABLED:
+            try:
+                from rich.console import Console
+                RICH_AVAILABLE = True
+            except ImportError:
+                RICH_AVAILABLE = False
+        console = Console() if RICH_AVAILABLE else SimpleConsole()
+    return console
+
+
+def load_env_settings() -> None:
+    """Read the CLI settings taken from environment variables.
+    
+    Called when this module is imported. The daemon calls it again for each
+    invocation, after applying the environment of the client.
+    """
+    global RICH_DISABLED, DEBUG_MODE, console
+    rich_disabled = os.environ.get("TASKNOTE_NO_RICH", "").lower() in ("1", "true", "yes")
+    if rich_disabled != RICH_DISABLED:
+        # Choose the console again on next use
+        console = None
+    RICH_DISABLED = rich_disabled
+    DEBUG_MODE = os.environ.get("TASKNOTE_CLI_DEBUG", "") != ""
+
+
+load_env_settings()
 
 # Dictionary to store command-specific formatters
 formatters = {}
@@ -67,9 +104,12 @@ def format_and_display_result(result):
     Args:
         result: The CmdResult object to format and display
     """
+    console = get_console()
+    
     if not result.success:
         # For failed commands, display an error message
         if RICH_AVAILABLE:
+            from rich.text import Text
             error_text = Text(f"Error: {result.message}", style="bold red")
             console.print(error_text, file=sys.stderr)
         else:
@@ -80,8 +120,9 @@ def format_and_display_result(result):
     command = result.command
     
     # Dispatch to command-specific formatter if available
-    if command in formatters:
-        formatters[command](result, console, RICH_AVAILABLE)
+    formatter = get_formatter(command)
+    if formatter is not None:
+        formatter(result, console, RICH_AVAILABLE)
     else:
         # Default formatter for commands without a specific formatter
         default_formatter(result, console, RICH_AVAILABLE)
@@ -95,53 +136,78 @@ def default_formatter(result, console, rich_available):
         console: The console to print to
         rich_available: Whether Rich is available for enhanced output
     """
+    # Data is shown as JSON if present
+    data_json = None
+    if result.data:
+        import json
+        data_json = json.dumps(result.data, indent=2)
+    
     if rich_available:
-        console.print(f"[green]{result.message}[/green]")
+        # Pass a Text so Rich does not parse the message as markup
+        from rich.text import Text
+        console.print(Text(result.message, style="green"))
         
-        # Print data as JSON if present
-        if result.data:
-            console.print(json.dumps(result.data, indent=2))
+        if data_json is not None:
+            console.print(data_json)
     else:
-        # Simple output without Rich formatting
-        print(result.message)
+        # Simple output without Rich formatting, written in one call
+        lines = [result.message]
+        
+        if data_json is not None:
+            lines.append(data_json)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Command name -> (module, parser setup function, result formatter or None).
+# Command modules are imported on demand so a single invocation only loads
+# the module of the command being run.
+COMMAND_MODULES: Dict[str, Tuple[str, str, Optional[str]]] = {
+    "init": ("tasknotes.cli.cmd_init", "setup_init_parser", "format_init_result"),
+    "add": ("tasknotes.cli.cmd_add", "setup_add_parser", None),
+    "note": ("tasknotes.cli.cmd_note", "setup_note_parser", None),
+    "edit": ("tasknotes.cli.cmd_edit", "setup_edit_parser", None),
+    "list": ("tasknotes.cli.cmd_list", "setup_list_parser", "format_list_result"),
+    "archive": ("tasknotes.cli.cmd_archive", "setup_archive_parser", None),
+    "remove": ("tasknotes.cli.cmd_remove", "setup_remove_parser", None),
+    "open": ("tasknotes.cli.cmd_open", "setup_open_parser", None),
+    "active": ("tasknotes.cli.cmd_active", "setup_active_parser", None),
+    "close": ("tasknotes.cli.cmd_close", "setup_close_parser", None),
+    "done": ("tasknotes.cli.cmd_done", "setup_done_parser", None),
+    "tag": ("tasknotes.cli.cmd_tag", "setup_tag_parser", None),
+    "search": ("tasknotes.cli.cmd_search", "setup_search_parser", "format_search_result"),
+    "help": ("tasknotes.cli.cmd_help", "setup_help_parser", None),
+    "mcp": ("tasknotes.cli.cmd_mcp", "setup_mcp_parser", None),
+}
+
+
+def get_formatter(command: str) -> Optional[Callable]:
+    """Get the formatter function for a command, importing it on first use.
+    
+    Args:
+        command: The command name
         
-        # Print data as JSON if present
-        if result.data:
-            print(json.dumps(result.data, indent=2))
-
-
-# Import command modules and their formatters
-from tasknotes.cli.cmd_init import setup_init_parser, format_init_result
-from tasknotes.cli.cmd_list import setup_list_parser, format_list_result
-from tasknotes.cli.cmd_search import setup_search_parser, format_search_result
-
-# Import other command modules
-from tasknotes.cli.cmd_add import setup_add_parser
-from tasknotes.cli.cmd_note import setup_note_parser
-from tasknotes.cli.cmd_edit import setup_edit_parser
-from tasknotes.cli.cmd_archive import setup_archive_parser
-from tasknotes.cli.cmd_remove import setup_remove_parser
-from tasknotes.cli.cmd_open import setup_open_parser
-from tasknotes.cli.cmd_active import setup_active_parser
-from tasknotes.cli.cmd_close import setup_close_parser
-from tasknotes.cli.cmd_done import setup_done_parser
-from tasknotes.cli.cmd_tag import setup_tag_parser
-from tasknotes.cli.cmd_help import setup_help_parser
-from tasknotes.cli.cmd_mcp import setup_mcp_parser
-
-# Register formatters for specific commands
-register_formatter("init", format_init_result)
-register_formatter("list", format_list_result)
-register_formatter("search", format_search_result)
+    Returns:
+        Optional[Callable]: The formatter function, or None if the command has none
+    """
+    formatter = formatters.get(command)
+    if formatter is None:
+        module_name, _setup, formatter_name = COMMAND_MODULES.get(command, (None, None, None))
+        if formatter_name is not None:
+            formatter = getattr(importlib.import_module(module_name), formatter_name)
+            register_formatter(command, formatter)
+    return formatter
 
 
 def is_debug_mode() -> bool:
     """Check if debug mode is enabled via environment variable.
     
+    The variable is read by load_env_settings(), when this module is imported.
+    
     Returns:
         bool: True if debug mode is enabled, False otherwise
     """
-    return os.environ.get("TASKNOTE_CLI_DEBUG", "") != ""
+    return DEBUG_MODE
 
 
 def not_implemented_error() -> None:
@@ -152,8 +218,12 @@ def not_implemented_error() -> None:
     )
 
 
-def setup_parsers() -> argparse.ArgumentParser:
-    """Set up the main parser and all subparsers.
+def setup_parsers(commands: Optional[Iterable[str]] = None) -> argparse.ArgumentParser:
+    """Set up the main parser and the command subparsers.
+    
+    Args:
+        commands: Names of the commands whose subparsers are set up.
+                  Defaults to all commands.
     
     Returns:
         argparse.ArgumentParser: The configured argument parser
@@ -183,53 +253,85 @@ def setup_parsers() -> argparse.ArgumentParser:
     )
     
     # Set up each command's parser
-    setup_init_parser(subparsers)
-    setup_add_parser(subparsers)
-    setup_note_parser(subparsers)
-    setup_edit_parser(subparsers)
-    setup_list_parser(subparsers)
-    setup_archive_parser(subparsers)
-    setup_remove_parser(subparsers)
-    setup_open_parser(subparsers)
-    setup_active_parser(subparsers)
-    setup_close_parser(subparsers)
-    setup_done_parser(subparsers)
-    setup_tag_parser(subparsers)
-    setup_search_parser(subparsers)
-    setup_help_parser(subparsers)
-    setup_mcp_parser(subparsers)
+    for name in COMMAND_MODULES if commands is None else commands:
+        module_name, setup_name, _formatter = COMMAND_MODULES[name]
+        getattr(importlib.import_module(module_name), setup_name)(subparsers)
     
     return parser
 
 
-# The _ function is imported from i18n module
+@functools.lru_cache(maxsize=None)
+def get_parser(commands: Optional[Tuple[str, ...]] = None) -> argparse.ArgumentParser:
+    """Get the argument parser for a set of commands, setting it up on first use.
+    
+    Parsers are reused across calls to main() in the same process, such as
+    in the daemon or when testing several command lines.
+    
+    Args:
+        commands: Names of the commands whose subparsers are set up.
+                  Defaults to all commands.
+    
+    Returns:
+        argparse.ArgumentParser: The configured argument parser
+    """
+    return setup_parsers(commands)
+
+
+def peek_commands(argv: List[str]) -> Optional[Tuple[str, ...]]:
+    """Find the commands whose subparsers are needed to parse the arguments.
+    
+    Args:
+        argv: The command line arguments without the program name
+        
+    Returns:
+        Optional[Tuple[str, ...]]: The command names, or None if all subparsers
+        are needed (no command, --help, the help command or an unknown command)
+    """
+    if not argv:
+        return None
+    first = argv[0]
+    if first == "--version":
+        # argparse exits on --version before looking at the subcommand
+        return ()
+    if first == "help" or first not in COMMAND_MODULES:
+        return None
+    return (first,)
 
 
-def register_commands() -> None:
-    """Register command implementations."""
-    # Use the register_all_commands function to register all available commands
-    register_all_commands()
+# The _ function is imported from i18n module
 
 
-def main() -> None:
-    """Main entry point for the CLI."""
-    # Register command implementations
-    register_commands()
+def main(argv: Optional[List[str]] = None, task_env: Optional['TaskNoteEnv'] = None) -> None:
+    """Main entry point for the CLI.
+    
+    Args:
+        argv: The command line arguments without the program name.
+              Defaults to sys.argv[1:].
+        task_env: The task environment to run commands in. Defaults to a new
+                  one for the current directory (the daemon passes a cached one).
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Forward the invocation to a running daemon if one is configured
+    socket_path = os.environ.get("TASKNOTE_DAEMON")
+    if socket_path:
+        from tasknotes.cli.daemon import forward, should_forward
+        if should_forward(argv):
+            exit_code = forward(socket_path, argv)
+            if exit_code is not None:
+                sys.exit(exit_code)
     
     # Parse command line arguments
-    parser = setup_parsers()
-    args = parser.parse_args()
+    parser = get_parser(peek_commands(argv))
+    args = parser.parse_args(argv)
+    
+    # Only load the command layer once the arguments are valid
+    from tasknotes.cmds.cmd_factory import cmd_factory
     
     # Get the command name
     command = args.command
     
-    # Create a TaskNoteEnv for the current directory
-    cwd = os.getcwd()
-    task_env = TaskNoteEnv(cwd)
-    
-    # Create a command service with the task environment
-    cmd_service = CmdService(task_env)
-    
     # Create a command from the arguments
     cmd = cmd_factory.create_from_args(command, args)
     
@@ -239,9 +341,20 @@ def main() -> None:
     
     if is_debug_mode():
         # In debug mode, just print the command and exit
+        import json
         print(json.dumps(cmd.to_json(), indent=2))
     else:
         # In normal mode, execute the command
+        from tasknotes.cmds.cmd_service import CmdService
+        
+        # Create a TaskNoteEnv for the current directory
+        if task_env is None:
+            from tasknotes.core.task_env import TaskNoteEnv
+            task_env = TaskNoteEnv(os.getcwd())
+        
+        # Create a command service with the task environment
+        cmd_service = CmdService(task_env)
+        
         # Add the command to the service
         cmd_service.add_cmd(cmd)
         
@@ -0,0 +1,27 @@
+"""Plain text output helpers for the TaskNotes CLI."""
+
+import sys
+
+
+def write_text(text: str) -> None:
+    """Write text to stdout with a single encode and a single write.
+    
+    The text is encoded once and written to the binary buffer underneath
+    sys.stdout, so large outputs skip the per-write work of the text layer.
+    Streams without a binary buffer, such as a redirected io.StringIO, get
+    the text written to them directly.
+    
+    Args:
+        text: The complete output, including its trailing newline
+    """
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None:
+        stdout.write(text)
+        return
+    
+    data = text.encode(stdout.encoding or "utf-8", stdout.errors or "strict")
+    # Keep earlier text output ahead of the bytes written below
+    stdout.flush()
+    buffer.write(data)
+    buffer.flush()
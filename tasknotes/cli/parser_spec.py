@@ -0,0 +1,32 @@
+"""Table-driven setup of the command subparsers."""
+
+import argparse
+from typing import Any, Dict, Sequence, Tuple
+
+# Flags of an argument and the keyword options passed to add_argument
+ArgumentSpec = Tuple[Tuple[str, ...], Dict[str, Any]]
+
+
+def add_command_parser(
+    subparsers: Any,
+    name: str,
+    help: str,
+    description: str,
+    arguments: Sequence[ArgumentSpec]
+) -> argparse.ArgumentParser:
+    """Add the parser for a command and register its arguments.
+    
+    Args:
+        subparsers: The subparsers object from the main parser
+        name: The command name
+        help: Translated help text shown in the command list
+        description: Translated description shown in the command's help
+        arguments: The command's arguments in registration order
+        
+    Returns:
+        argparse.ArgumentParser: The parser for the command
+    """
+    parser = subparsers.add_parser(name, help=help, description=description)
+    for flags, options in arguments:
+        parser.add_argument(*flags, **options)
+    return parser
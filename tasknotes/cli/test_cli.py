@@ -14,7 +14,7 @@ import shlex
 from tasknotes.cli.main import main
 
 def test_command(command_line):
-    """Test a command by setting sys.argv and calling main().
+    """Test a command by passing its arguments to main().
     
     Args:
         command_line: A command line string to parse and execute
@@ -25,8 +25,7 @@ def test_command(command_line):
     # This correctly handles quotes, escapes, etc.
     args = shlex.split(command_line)
     
-    sys.argv = ["tasknote"] + args
-    main()
+    main(args)
     print("-" * 40)
 
 if __name__ == "__main__":
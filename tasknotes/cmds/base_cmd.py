@@ -1,18 +1,26 @@
 """Base command class for TaskNotes command queue system."""
 
-import abc
 import io
 import json
 import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, TextIO, Union, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, TextIO, Type, TypeVar, Union, TYPE_CHECKING
 
 # Import TaskNoteEnv for type checking
 if TYPE_CHECKING:
     from tasknotes.core.task_env import TaskNoteEnv
 
+# Encoder rendering results and commands as JSON indented by two spaces. The
+# text is the same as json.dumps(obj, indent=2), without re-creating the
+# encoder for every call.
+_encode_json = json.JSONEncoder(indent=2).encode
 
-@dataclass
+# A CmdResult is created for every executed command, so its fields are kept
+# in slots on Python versions whose dataclasses support them (3.10+)
+_RESULT_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class CmdResult:
     """Result of a command execution.
     
@@ -49,11 +57,15 @@ class CmdResult:
         Returns:
             str: A string representation of the command result
         """
-        return json.dumps(self.to_json(), indent=2)
+        return _encode_json(self.to_json())
 
 
-class BaseCmd(abc.ABC):
-    """Base class for all commands in the command queue system."""
+class BaseCmd:
+    """Base class for all commands in the command queue system.
+    
+    Subclasses implement _execute_impl. This is a plain class rather than an
+    abc.ABC, so constructing a command skips the ABCMeta instance checks.
+    """
     
     def __init__(
         self,
@@ -74,11 +86,10 @@ class BaseCmd(abc.ABC):
         """
         self.command = command
         self.args = args
-        self.stdin = stdin or sys.stdin
-        self.stdout = stdout or sys.stdout
-        self.stderr = stderr or sys.stderr
+        self.stdin = stdin if stdin is not None else sys.stdin
+        self.stdout = stdout if stdout is not None else sys.stdout
+        self.stderr = stderr if stderr is not None else sys.stderr
     
-    @abc.abstractmethod
     def _execute_impl(self, cmd_service: 'CmdService', task_env: 'TaskNoteEnv') -> CmdResult:
         """Implementation of the command execution.
         
@@ -90,8 +101,11 @@ class BaseCmd(abc.ABC):
             
         Returns:
             CmdResult: The result of the command execution
+            
+        Raises:
+            NotImplementedError: If the subclass does not implement the command
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} does not implement _execute_impl")
     
     def execute(self, cmd_service: 'CmdService', task_env: 'TaskNoteEnv') -> CmdResult:
         """Execute the command and populate the result with command information.
@@ -108,7 +122,9 @@ class BaseCmd(abc.ABC):
         """
         result = self._execute_impl(cmd_service, task_env)
         
-        # Populate command information in the result
+        # Populate command information in the result. The arguments are
+        # copied (shallowly) so the result stays a plain value that can be
+        # pickled or deep-copied and isn't affected by later changes to args.
         result.command = self.command
         result.command_args = self.args.copy()
         
@@ -130,16 +146,8 @@ class BaseCmd(abc.ABC):
         if self.stdin is sys.stdin:
             result["stdin"] = "<stdin>"
         elif isinstance(self.stdin, io.StringIO):
-            # Get the current position
-            pos = self.stdin.tell()
-            # Rewind to the beginning
-            self.stdin.seek(0)
-            # Read the content
-            content = self.stdin.read()
-            # Restore the position
-            self.stdin.seek(pos)
-            # Add the content to the result
-            result["stdin"] = content
+            # Include the whole content without moving the read position
+            result["stdin"] = self.stdin.getvalue()
         else:
             result["stdin"] = "<custom>"
         
@@ -155,7 +163,31 @@ class BaseCmd(abc.ABC):
         Returns:
             str: A string representation of the command result
         """
-        return json.dumps(self.to_json(), indent=2)
+        return _encode_json(self.to_json())
+
+
+# Command classes registered with @register, keyed by command name
+COMMANDS: Dict[str, Type[BaseCmd]] = {}
+
+_CmdClass = TypeVar("_CmdClass", bound=Type[BaseCmd])
+
+
+def register(name: str) -> Callable[[_CmdClass], _CmdClass]:
+    """Class decorator registering a command class under a command name.
+    
+    Importing a command module is enough to make its command available to
+    the command factory, which dispatches through COMMANDS.
+    
+    Args:
+        name: The command name
+        
+    Returns:
+        Callable[[_CmdClass], _CmdClass]: The decorator
+    """
+    def decorator(cls: _CmdClass) -> _CmdClass:
+        COMMANDS[name] = cls
+        return cls
+    return decorator
 
 
 def create_string_input(content: Union[str, List[str]]) -> TextIO:
@@ -170,4 +202,16 @@ def create_string_input(content: Union[str, List[str]]) -> TextIO:
     if isinstance(content, list):
         content = "\n".join(content)
     
-    return io.StringIO(content)
\ No newline at end of file
+    return io.StringIO(content)
+
+
+def create_string_input_from_list(lines: List[str]) -> TextIO:
+    """Create a string input stream from a list of lines.
+    
+    Args:
+        lines: The lines to use as input, joined with newlines
+        
+    Returns:
+        TextIO: A text input stream containing the lines
+    """
+    return io.StringIO("\n".join(lines))
\ No newline at end of file
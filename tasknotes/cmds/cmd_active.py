@@ -2,10 +2,11 @@
 
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("active")
 class ActiveCmd(BaseCmd):
     """Command to manage active tasks."""
     
@@ -22,7 +23,8 @@ class ActiveCmd(BaseCmd):
         # In a real implementation, this would list active tasks from the repository
         # For now, we just return a success result with mock active tasks
         
-        # Create mock active tasks
+        # Create mock active tasks. They are built per call, because callers
+        # may modify the tasks of the result.
         active_tasks = [
             {"id": "TASK-001", "title": "Implement CLI parsing", "status": "active", "tags": ["important", "urgent"]}
         ]
@@ -2,10 +2,11 @@
 
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("add")
 class AddCmd(BaseCmd):
     """Command to add a new task to the current active task."""
     
@@ -20,13 +21,15 @@ class AddCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        parent_id = self.args.get("parent")
-        tags = self.args.get("tag", [])
-        title = self.args.get("title", "")
+        args = self.args
+        parent_id = args.get("parent")
+        tags = args.get("tag") or ()
+        title = args.get("title")
         
         # If no title is provided, check positional arguments
-        if not title and len(self.args.get("_", [])) > 0:
-            title = self.args.get("_")[0]
+        if not title:
+            positional = args.get("_") or ()
+            title = positional[0] if positional else ""
         
         # Validate arguments
         if not title:
@@ -2,10 +2,11 @@
 
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("close")
 class CloseCmd(BaseCmd):
     """Command to close active tasks."""
     
@@ -20,9 +21,8 @@ class CloseCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        task_id = None
-        if "_" in self.args and self.args["_"]:
-            task_id = self.args["_"][0]
+        positional = self.args.get("_") or ()
+        task_id = positional[0] if positional else None
         
         # In a real implementation, this would close the active task in the repository
         # For now, we just return a success result
@@ -4,10 +4,11 @@ import os
 import subprocess
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("edit")
 class EditCmd(BaseCmd):
     """Command to open a task in the default editor."""
     
@@ -22,9 +23,8 @@ class EditCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        task_id = None
-        if "_" in self.args and self.args["_"]:
-            task_id = self.args["_"][0]
+        positional = self.args.get("_") or ()
+        task_id = positional[0] if positional else None
         
         # Validate arguments
         if not task_id:
@@ -1,19 +1,59 @@
 """Factory for creating command objects from CLI arguments."""
 
-import argparse
+import importlib
+import os
+import pkgutil
 import sys
-from typing import Any, Dict, List, Optional, TextIO, Type
+import types
+from typing import Any, Dict, List, Mapping, Optional, TextIO, Type, TYPE_CHECKING
 
-from tasknotes.core.base_cmd import BaseCmd, create_string_input
-from tasknotes.cmds.cmd_init import InitCmd
+from tasknotes.cmds.base_cmd import COMMANDS, BaseCmd, create_string_input_from_list
+
+# Import argparse for type checking
+if TYPE_CHECKING:
+    import argparse
+
+
+# Modules in this package whose names start with "cmd_" but that do not
+# define a command
+_NON_COMMAND_MODULES = ("cmd_factory", "cmd_service")
+
+
+def _find_command_modules() -> Dict[str, str]:
+    """Find the command modules in this package.
+    
+    Every cmd_<name>.py module, other than the factory and the service,
+    defines the command <name>, so new commands need no factory changes.
+    
+    Returns:
+        Dict[str, str]: Command name -> fully qualified module name
+    """
+    package = __name__.rpartition(".")[0]
+    return {
+        name[len("cmd_"):]: f"{package}.{name}"
+        for _finder, name, is_pkg in pkgutil.iter_modules([os.path.dirname(__file__)])
+        if name.startswith("cmd_") and not is_pkg and name not in _NON_COMMAND_MODULES
+    }
+
+
+# Command name -> module defining the command. Modules are imported the first
+# time their command is requested; importing a module registers its command
+# class through the @register decorator.
+_CMD_MODULES: Dict[str, str] = _find_command_modules()
 
 
 class CommandFactory:
     """Factory for creating command objects from CLI arguments."""
     
     def __init__(self):
-        """Initialize the command factory."""
-        self.cmd_registry: Dict[str, Type[BaseCmd]] = {}
+        """Initialize the command factory.
+        
+        The registry is a read-only view of the commands registered with the
+        @register decorator, so command classes are available as soon as
+        their module is imported. Its bound get method is cached for dispatch.
+        """
+        self.cmd_registry: Mapping[str, Type[BaseCmd]] = types.MappingProxyType(COMMANDS)
+        self._get_cmd = self.cmd_registry.get
     
     def register_cmd(self, cmd_name: str, cmd_class: Type[BaseCmd]) -> None:
         """Register a command class for a command name.
@@ -22,12 +62,35 @@ class CommandFactory:
             cmd_name: The command name
             cmd_class: The command class
         """
-        self.cmd_registry[cmd_name] = cmd_class
+        COMMANDS[sys.intern(cmd_name)] = cmd_class
+    
+    def get_cmd_class(self, command: str) -> Optional[Type[BaseCmd]]:
+        """Get the command class for a command name, importing it on first use.
+        
+        Args:
+            command: The command name
+            
+        Returns:
+            Optional[Type[BaseCmd]]: The command class, or None if the command is unknown
+        """
+        cmd_class = self._get_cmd(command)
+        if cmd_class is None and command in _CMD_MODULES:
+            module_name = _CMD_MODULES[command]
+            try:
+                importlib.import_module(module_name)
+            except ModuleNotFoundError as e:
+                # Only a missing command module means the command is not
+                # available; errors inside the module are real bugs
+                if e.name != module_name:
+                    raise
+                return None
+            cmd_class = self._get_cmd(command)
+        return cmd_class
     
     def create_from_args(
         self,
         command: str,
-        args: argparse.Namespace,
+        args: 'argparse.Namespace',
         stdin: Optional[TextIO] = None,
         stdout: Optional[TextIO] = None,
         stderr: Optional[TextIO] = None
@@ -44,7 +107,13 @@ class CommandFactory:
         Returns:
             Optional[BaseCmd]: The created command instance, or None if the command is not registered
         """
-        cmd_class = self.cmd_registry.get(command)
+        if command is None:
+            return None
+        
+        # Command names parsed from the command line are not interned, so
+        # intern them to make the registry lookup and name checks cheap
+        command = sys.intern(command)
+        cmd_class = self.get_cmd_class(command)
         if cmd_class is None:
             return None
         
@@ -64,7 +133,8 @@ class CommandFactory:
     ) -> TextIO:
         """Prepare stdin for the command based on arguments.
         
-        This handles special cases like multiple -m flags or -f - for reading from stdin.
+        Multiple -m flags of the note command become the command's stdin.
+        Otherwise, including -f - for reading from stdin, the given stdin is used.
         
         Args:
             command: The command name
@@ -74,116 +144,24 @@ class CommandFactory:
         Returns:
             TextIO: The prepared stdin
         """
-        # Default to system stdin if not provided
-        stdin = stdin or sys.stdin
-        
         # Handle note command with multiple -m flags
-        if command == "note" and "message" in args_dict and args_dict["message"]:
-            messages = args_dict["message"]
-            if isinstance(messages, list) and len(messages) > 0:
-                return create_string_input(messages)
-        
-        # Handle file input from stdin
-        if "file" in args_dict and args_dict["file"] == "-":
-            # Using stdin as file input, so we keep it as is
-            return stdin
+        if command == "note":
+            messages = args_dict.get("message")
+            if messages and isinstance(messages, list):
+                return create_string_input_from_list(messages)
         
-        return stdin
-
+        # Default to system stdin if not provided
+        return stdin if stdin is not None else sys.stdin
 
 # Create a singleton instance
 cmd_factory = CommandFactory()
 
-# Import and register all command implementations
-def register_all_commands():
-    """Register all command implementations."""
-    from tasknotes.cmds.cmd_init import InitCmd
-    cmd_factory.register_cmd("init", InitCmd)
-    
-    # Import and register other commands as they are implemented
-    try:
-        from tasknotes.cmds.cmd_add import AddCmd
-        cmd_factory.register_cmd("add", AddCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_note import NoteCmd
-        cmd_factory.register_cmd("note", NoteCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_edit import EditCmd
-        cmd_factory.register_cmd("edit", EditCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_list import ListCmd
-        cmd_factory.register_cmd("list", ListCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_archive import ArchiveCmd
-        cmd_factory.register_cmd("archive", ArchiveCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_remove import RemoveCmd
-        cmd_factory.register_cmd("remove", RemoveCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_open import OpenCmd
-        cmd_factory.register_cmd("open", OpenCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_active import ActiveCmd
-        cmd_factory.register_cmd("active", ActiveCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_close import CloseCmd
-        cmd_factory.register_cmd("close", CloseCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_done import DoneCmd
-        cmd_factory.register_cmd("done", DoneCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_tag import TagCmd
-        cmd_factory.register_cmd("tag", TagCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_search import SearchCmd
-        cmd_factory.register_cmd("search", SearchCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_help import HelpCmd
-        cmd_factory.register_cmd("help", HelpCmd)
-    except ImportError:
-        pass
-    
-    try:
-        from tasknotes.cmds.cmd_mcp import McpCmd
-        cmd_factory.register_cmd("mcp", McpCmd)
-    except ImportError:
-        pass
 
-# Register the init command by default
-cmd_factory.register_cmd("init", InitCmd)
+def register_all_commands() -> None:
+    """Import and register all command implementations.
+    
+    Commands are otherwise imported on first use, so this is only needed by
+    callers that want every command registered up front.
+    """
+    for command in _CMD_MODULES:
+        cmd_factory.get_cmd_class(command)
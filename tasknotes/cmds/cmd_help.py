@@ -1,11 +1,36 @@
 """Implementation of the 'help' command."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
+# Mock help information, keyed by command name
+_HELP_INFO: Dict[str, str] = {
+    "init": "Initialize a TaskNote repository",
+    "add": "Add a new task to the current active task",
+    "note": "Add or edit notes for a specified task",
+    "edit": "Open a task in the default editor",
+    "list": "List tasks with optional filtering",
+    "archive": "Archive a specified task",
+    "remove": "Remove a specified task",
+    "open": "Set a task as active",
+    "active": "Manage active tasks",
+    "close": "Close active tasks",
+    "done": "Mark a task as completed",
+    "tag": "Manage task tags",
+    "search": "Search for tasks and notes",
+    "help": "Display help information for commands",
+    "mcp": "Start the MCP server"
+}
 
+# Mock help information for all commands, in display order
+_COMMANDS_LIST: Tuple[Dict[str, str], ...] = tuple(
+    {"name": name, "description": description} for name, description in _HELP_INFO.items()
+)
+
+
+@register("help")
 class HelpCmd(BaseCmd):
     """Command to display help information for commands."""
     
@@ -20,14 +45,13 @@ class HelpCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        command = None
-        if "_" in self.args and self.args["_"]:
-            command = self.args["_"][0]
+        positional = self.args.get("_") or ()
+        command = positional[0] if positional else self.args.get("topic")
         
         # If a specific command is requested, show help for that command
         if command:
             # Check if the command exists
-            if command not in cmd_service.cmd_registry:
+            if command not in _HELP_INFO:
                 return CmdResult(
                     success=False,
                     message=f"Unknown command '{command}'",
@@ -37,58 +61,23 @@ class HelpCmd(BaseCmd):
             
             # In a real implementation, this would get help information for the command
             # For now, we just return a success result with mock help information
-            help_info = {
-                "init": "Initialize a TaskNote repository",
-                "add": "Add a new task to the current active task",
-                "note": "Add or edit notes for a specified task",
-                "edit": "Open a task in the default editor",
-                "list": "List tasks with optional filtering",
-                "archive": "Archive a specified task",
-                "remove": "Remove a specified task",
-                "open": "Set a task as active",
-                "active": "Manage active tasks",
-                "close": "Close active tasks",
-                "done": "Mark a task as completed",
-                "tag": "Manage task tags",
-                "search": "Search for tasks and notes",
-                "help": "Display help information for commands",
-                "mcp": "Start the MCP server"
-            }
-            
+            help_text = _HELP_INFO.get(command) or "No help available"
             return CmdResult(
                 success=True,
-                message=f"Help for command '{command}': {help_info.get(command, 'No help available')}",
+                message=f"Help for command '{command}': {help_text}",
                 data={
                     "command": command,
-                    "help": help_info.get(command, 'No help available')
+                    "help": help_text
                 }
             )
         
         # Otherwise, show general help
         # In a real implementation, this would get help information for all commands
         # For now, we just return a success result with mock help information
-        commands = [
-            {"name": "init", "description": "Initialize a TaskNote repository"},
-            {"name": "add", "description": "Add a new task to the current active task"},
-            {"name": "note", "description": "Add or edit notes for a specified task"},
-            {"name": "edit", "description": "Open a task in the default editor"},
-            {"name": "list", "description": "List tasks with optional filtering"},
-            {"name": "archive", "description": "Archive a specified task"},
-            {"name": "remove", "description": "Remove a specified task"},
-            {"name": "open", "description": "Set a task as active"},
-            {"name": "active", "description": "Manage active tasks"},
-            {"name": "close", "description": "Close active tasks"},
-            {"name": "done", "description": "Mark a task as completed"},
-            {"name": "tag", "description": "Manage task tags"},
-            {"name": "search", "description": "Search for tasks and notes"},
-            {"name": "help", "description": "Display help information for commands"},
-            {"name": "mcp", "description": "Start the MCP server"}
-        ]
-        
         return CmdResult(
             success=True,
             message="TaskNote CLI Help",
             data={
-                "commands": commands
+                "commands": _COMMANDS_LIST
             }
         )
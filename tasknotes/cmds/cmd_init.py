@@ -3,10 +3,11 @@
 import os
 from typing import Any, Dict
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("init")
 class InitCmd(BaseCmd):
     """Command to initialize a TaskNote repository."""
     
@@ -26,9 +27,9 @@ class InitCmd(BaseCmd):
         
         # First explicitly check if already initialized
         # This provides a clearer semantic distinction between already initialized and new initialization
-        if task_env.is_tasknote_init():
-            # Get the current mode (GIT or LOCAL) for better reporting
-            current_mode = "GIT" if task_env.is_git_repo() and task_env.has_tasknote_branch() else "LOCAL"
+        current_mode = task_env.mode
+        if current_mode is not None:
+            # Report the current mode (GIT or LOCAL)
             return CmdResult(
                 success=True,
                 message=f"TaskNote repository already initialized in {current_mode} mode",
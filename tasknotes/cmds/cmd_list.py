@@ -2,10 +2,11 @@
 
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("list")
 class ListCmd(BaseCmd):
     """Command to list tasks with optional filtering."""
     
@@ -20,11 +21,16 @@ class ListCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        tags = self.args.get("tag", [])
+        args = self.args
+        tags = args.get("tag", [])
+        if isinstance(tags, str):
+            # The list parser takes a single --tag value
+            tags = [tags]
         status = None
         
         # Check if we're listing active tasks
-        if "_" in self.args and self.args["_"] and self.args["_"][0] == "active":
+        positional = args.get("_") or ()
+        if positional and positional[0] == "active":
             status = "active"
         
         # In a real implementation, this would list tasks from the repository
@@ -37,16 +43,15 @@ class ListCmd(BaseCmd):
             {"id": "TASK-003", "title": "Fix bugs", "status": "open", "tags": ["bug", "important"]}
         ]
         
-        # Apply filters
-        if status:
-            tasks = [task for task in tasks if task["status"] == status]
-        
-        if tags:
-            filtered_tasks = []
-            for task in tasks:
-                if any(tag in task["tags"] for tag in tags):
-                    filtered_tasks.append(task)
-            tasks = filtered_tasks
+        # Apply the status and tag filters in a single pass. A task matches the
+        # tag filter if it has any of the requested tags.
+        if status or tags:
+            tag_set = set(tags) if tags else None
+            tasks = [
+                task for task in tasks
+                if (not status or task["status"] == status)
+                and (tag_set is None or not tag_set.isdisjoint(task["tags"]))
+            ]
         
         return CmdResult(
             success=True,
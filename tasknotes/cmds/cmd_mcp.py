@@ -3,10 +3,11 @@
 import os
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("mcp")
 class McpCmd(BaseCmd):
     """Command to start the MCP server."""
     
@@ -21,9 +22,10 @@ class McpCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        port = self.args.get("port", 8080)
-        host = self.args.get("host", "localhost")
-        auth = self.args.get("auth")
+        args = self.args
+        port = args.get("port", 8080)
+        host = args.get("host", "localhost")
+        auth = args.get("auth")
         
         # In a real implementation, this would start the MCP server
         # For now, we just return a success result
@@ -2,10 +2,11 @@
 
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("note")
 class NoteCmd(BaseCmd):
     """Command to add or edit notes for a specified task."""
     
@@ -20,10 +21,11 @@ class NoteCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        task_id = self.args.get("task")
-        category = self.args.get("category", "general")
-        messages = self.args.get("message", [])
-        file_input = self.args.get("file")
+        args = self.args
+        task_id = args.get("task")
+        category = args.get("category", "general")
+        messages = args.get("message", [])
+        file_input = args.get("file")
         
         # Validate arguments
         if not task_id:
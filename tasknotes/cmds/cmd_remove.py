@@ -2,10 +2,11 @@
 
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("remove")
 class RemoveCmd(BaseCmd):
     """Command to remove a specified task."""
     
@@ -20,12 +21,12 @@ class RemoveCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        task_id = None
-        if "_" in self.args and self.args["_"]:
-            task_id = self.args["_"][0]
+        args = self.args
+        positional = args.get("_") or ()
+        task_id = positional[0] if positional else None
         
-        force = self.args.get("force", False)
-        confirmed = self.args.get("yes", False)
+        force = args.get("force", False)
+        confirmed = args.get("yes", False)
         
         # Validate arguments
         if not task_id:
@@ -2,10 +2,11 @@
 
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
 
+@register("search")
 class SearchCmd(BaseCmd):
     """Command to search for tasks and notes."""
     
@@ -20,12 +21,15 @@ class SearchCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        query = None
-        if "_" in self.args and self.args["_"]:
-            query = self.args["_"][0]
+        args = self.args
+        positional = args.get("_") or ()
+        query = positional[0] if positional else None
         
-        tags = self.args.get("tag", [])
-        notes = self.args.get("notes", False)
+        tags = args.get("tag", [])
+        if isinstance(tags, str):
+            # The search parser takes a single --tag value
+            tags = [tags]
+        notes = args.get("notes", False)
         
         # Validate arguments
         if not query:
@@ -45,13 +49,10 @@ class SearchCmd(BaseCmd):
             {"id": "TASK-003", "title": "Fix bugs", "status": "open", "tags": ["bug", "important"]}
         ]
         
-        # Apply tag filters
+        # Apply tag filters. A result matches if it has any of the requested tags.
         if tags:
-            filtered_results = []
-            for result in search_results:
-                if any(tag in result["tags"] for tag in tags):
-                    filtered_results.append(result)
-            search_results = filtered_results
+            tag_set = set(tags)
+            search_results = [result for result in search_results if not tag_set.isdisjoint(result["tags"])]
         
         # Include notes if requested
         note_results = []
@@ -1,15 +1,20 @@
 """Command service for managing command queues."""
 
-import json
+import io
+import operator
 import os
+import sys
 from collections import deque
-from typing import Any, Deque, Dict, List, Optional, Type, Union, TYPE_CHECKING
+from typing import Any, Deque, Dict, List, Optional, TextIO, Type, Union, TYPE_CHECKING
 
 # Import TaskNoteEnv for type checking
 if TYPE_CHECKING:
     from tasknotes.core.task_env import TaskNoteEnv
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, _encode_json
+
+# Call each command's own to_json(), so overrides in subclasses are honoured
+_cmd_to_json = operator.methodcaller("to_json")
 
 
 class CmdService:
@@ -24,6 +29,7 @@ class CmdService:
         self.task_env = task_env
         self.cmd_queue: Deque[BaseCmd] = deque()
         self.cmd_registry: Dict[str, Type[BaseCmd]] = {}
+        self._get_cmd = self.cmd_registry.get
         self.executed_cmds: List[BaseCmd] = []
         self.results: List[CmdResult] = []
         
@@ -38,7 +44,7 @@ class CmdService:
             cmd_name: The command name
             cmd_class: The command class
         """
-        self.cmd_registry[cmd_name] = cmd_class
+        self.cmd_registry[sys.intern(cmd_name)] = cmd_class
     
     def create_cmd(self, command: str, args: Dict[str, Any], **kwargs) -> Optional[BaseCmd]:
         """Create a command instance from a command name and arguments.
@@ -51,7 +57,7 @@ class CmdService:
         Returns:
             Optional[BaseCmd]: The created command instance, or None if the command is not registered
         """
-        cmd_class = self.cmd_registry.get(command)
+        cmd_class = self._get_cmd(command)
         if cmd_class is None:
             return None
         
@@ -76,18 +82,28 @@ class CmdService:
         """
         results = []
         
-        while self.cmd_queue:
-            cmd = self.cmd_queue.popleft()
-            result = cmd.execute(self, self.task_env)
-            self.executed_cmds.append(cmd)
-            self.results.append(result)
-            results.append(result)
+        # Bind the loop invariants once. The queue is drained one command at a
+        # time because commands may queue follow-up commands while executing.
+        # The history is recorded per command, so it is up to date while the
+        # next command runs.
+        queue = self.cmd_queue
+        task_env = self.task_env
+        record_cmd = self.executed_cmds.append
+        record_result = self.results.append
+        add_result = results.append
+        
+        while queue:
+            cmd = queue.popleft()
+            result = cmd.execute(self, task_env)
+            record_cmd(cmd)
+            record_result(result)
+            add_result(result)
             
             # Stop execution if a command fails
             if not result.success:
                 # Clear the remaining commands from the queue
                 # to avoid partial execution later
-                self.cmd_queue.clear()
+                queue.clear()
                 break
         
         return results
@@ -117,17 +133,40 @@ class CmdService:
         return {
             "queue": [cmd.to_json() for cmd in self.cmd_queue],
             "executed": [cmd.to_json() for cmd in self.executed_cmds],
-            "results": [
-                {
-                    "success": result.success,
-                    "message": result.message,
-                    "data": result.data,
-                    "exit_code": result.exit_code
-                }
-                for result in self.results
-            ]
+            "results": [_result_to_json(result) for result in self.results]
         }
     
+    def dump(self, fp: TextIO) -> None:
+        """Write the command service state to a text stream as indented JSON.
+        
+        The document has the same structure as to_json(), but each command and
+        result is encoded and written on its own, so neither the intermediate
+        lists nor the full JSON text are built in memory. The text is the same
+        as json.dumps(self.to_json(), indent=2).
+        
+        Args:
+            fp: The text stream to write to
+        """
+        write = fp.write
+        sections = (
+            ("queue", map(_cmd_to_json, self.cmd_queue)),
+            ("executed", map(_cmd_to_json, self.executed_cmds)),
+            ("results", map(_result_to_json, self.results))
+        )
+        
+        write("{")
+        for index, (name, items) in enumerate(sections):
+            write(f'{"," if index else ""}\n  "{name}": [')
+            separator = "\n    "
+            for item in items:
+                # Nest the item's own indentation two levels deeper. Encoded
+                # JSON strings never contain raw newlines.
+                write(separator)
+                write(_encode_json(item).replace("\n", "\n    "))
+                separator = ",\n    "
+            write("]" if separator == "\n    " else "\n  ]")
+        write("\n}")
+    
     def _create_default_task_env(self) -> None:
         """Create a default TaskNoteEnv instance for the current directory."""
         try:
@@ -145,4 +184,23 @@ class CmdService:
         Returns:
             str: A string representation of the command service
         """
-        return json.dumps(self.to_json(), indent=2)
+        buffer = io.StringIO()
+        self.dump(buffer)
+        return buffer.getvalue()
+
+
+def _result_to_json(result: CmdResult) -> Dict[str, Any]:
+    """Convert a command result to the JSON-serializable form used by CmdService.
+    
+    Args:
+        result: The command result to convert
+        
+    Returns:
+        Dict[str, Any]: The result's success flag, message, data and exit code
+    """
+    return {
+        "success": result.success,
+        "message": result.message,
+        "data": result.data,
+        "exit_code": result.exit_code
+    }
@@ -2,10 +2,19 @@
 
 from typing import Any, Dict, List, Optional
 
-from tasknotes.core.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult, register
 from tasknotes.core.task_env import TaskNoteEnv
 
+# Mock tags. Results get their own list copies, so callers may modify them.
+_MOCK_ALL_TAGS = ("important", "urgent", "bug", "documentation", "feature")
+_MOCK_TASK_TAGS = ("important", "urgent")
 
+# Messages that do not depend on the arguments
+_MISSING_TASK_ID_MESSAGE = "Task ID is required unless --list is specified"
+_LIST_MESSAGE = f"Found {len(_MOCK_ALL_TAGS)} tags"
+
+
+@register("tag")
 class TagCmd(BaseCmd):
     """Command to manage task tags."""
     
@@ -20,16 +29,17 @@ class TagCmd(BaseCmd):
             CmdResult: The result of the command execution
         """
         # Get command arguments
-        task_id = self.args.get("task")
-        add_tags = self.args.get("add", [])
-        remove_tags = self.args.get("remove", [])
-        list_tags = self.args.get("list", False)
+        args = self.args
+        task_id = args.get("task")
+        add_tags = args.get("add") or ()
+        remove_tags = args.get("remove") or ()
+        list_tags = args.get("list", False)
         
         # Validate arguments
         if not task_id and not list_tags:
             return CmdResult(
                 success=False,
-                message="Task ID is required unless --list is specified",
+                message=_MISSING_TASK_ID_MESSAGE,
                 data={"error": "missing_task_id"},
                 exit_code=1
             )
@@ -38,12 +48,11 @@ class TagCmd(BaseCmd):
         if list_tags:
             # In a real implementation, this would list all tags from the repository
             # For now, we just return a success result with mock tags
-            all_tags = ["important", "urgent", "bug", "documentation", "feature"]
             return CmdResult(
                 success=True,
-                message=f"Found {len(all_tags)} tags",
+                message=_LIST_MESSAGE,
                 data={
-                    "tags": all_tags
+                    "tags": list(_MOCK_ALL_TAGS)
                 }
             )
         
@@ -52,7 +61,7 @@ class TagCmd(BaseCmd):
             # Just list tags for the task
             # In a real implementation, this would get tags for the task from the repository
             # For now, we just return a success result with mock tags
-            task_tags = ["important", "urgent"]
+            task_tags = list(_MOCK_TASK_TAGS)
             return CmdResult(
                 success=True,
                 message=f"Task {task_id} has {len(task_tags)} tags",
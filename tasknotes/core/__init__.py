@@ -1,18 +1,47 @@
-"""Core functionality package for TaskNotes."""
-
-# from .task_manager import TaskManager
-# from .config import Config
-# from .models import Task
-from .task_env import TaskNoteEnv, setup_git_alias, find_file_service
-# from .edit_service import EditService, EditSession, Operation
-# from .markdown import MarkdownParser
-
-__all__ = [
-    # "TaskManager",  
-    "TaskNoteEnv", 
-    "setup_git_alias",
-    # "LocalFilesystem", 
-    # "GitRepoTree", 
-    # "create_file_service",
-    "MarkdownParser"
-]
+"""Core functionality package for TaskNotes.
+
+The public names are loaded from their submodules on first access, so that
+importing one core module (e.g. tasknotes.core.config) does not also import
+pygit2 and the other backends.
+"""
+
+import importlib
+from typing import Any, List
+
+# Public names, mapped to the submodule defining them
+_LAZY = {
+    "TaskNoteEnv": ".task_env",
+    "setup_git_alias": ".task_env",
+    "find_file_service": ".task_env",
+    "LocalFilesystem": ".fs_local",
+    "GitRepoTree": ".fs_git",
+    "EditService": ".edit_service",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """Load a public name from its submodule on first access.
+    
+    Args:
+        name: The attribute name
+    
+    Returns:
+        Any: The attribute, which is then cached in the package namespace
+    
+    Raises:
+        AttributeError: If the name is not a public name of the package
+    """
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the package attributes, including names not loaded yet."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,7 +1,65 @@
+import contextlib
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# Use the libyaml based loader if PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_config_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file, memoized by path and modification time.
+    
+    The returned dict is shared between callers and must not be modified.
+    
+    Args:
+        path: Path of the config file
+        mtime_ns: Modification time of the file, so edits are picked up
+        
+    Returns:
+        Dict[str, Any]: The parsed config, empty if the file is empty
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+@functools.lru_cache(maxsize=None)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot notation key into its parts, memoized per key.
+    
+    Args:
+        key: The dot notation key (e.g. 'git.branch_name')
+        
+    Returns:
+        Tuple[str, ...]: The parts of the key
+    """
+    return tuple(key.split('.'))
+
+
+def _setting(section: str, name: str) -> property:
+    """Create a read-only accessor for a two-level setting.
+    
+    Args:
+        section: The top-level key (e.g. 'git')
+        name: The key within the section (e.g. 'branch_name')
+        
+    Returns:
+        property: A property returning the setting, or None if it is not set
+    """
+    def getter(self: "Config") -> Any:
+        try:
+            return self._config[section][name]
+        except (KeyError, TypeError):
+            return None
+    
+    getter.__doc__ = f"The '{section}.{name}' setting, same as get('{section}.{name}')."
+    return property(getter)
+
 
 class Config:
     """
@@ -20,6 +78,12 @@ class Config:
         }
     }
     
+    # Accessors for the default settings, avoiding get()'s key parsing
+    local_task_dir = _setting("local", "task_dir")
+    git_branch_name = _setting("git", "branch_name")
+    git_user_name = _setting("git", "user_name")
+    git_user_email = _setting("git", "user_email")
+    
     def __init__(self, config_path: Optional[Path] = None):
         """
         Initialize the Config object.
@@ -29,16 +93,34 @@ class Config:
                          If not provided, defaults to ~/.tasknote.yml
         """
         self._config_path = config_path or Path.home() / ".tasknote.yml"
-        self._config = self._load_config()
+        # Nesting depth of batch() blocks and whether a save was deferred
+        self._batch_depth = 0
+        self._save_pending = False
+    
+    @functools.cached_property
+    def _config(self) -> Dict[str, Any]:
+        """The configuration, loaded on first access rather than on construction."""
+        return self._load_config()
+    
+    def reload(self) -> None:
+        """Load the configuration again on next access.
+        
+        Environment variable overrides are applied again, and changes made
+        with set() that were not saved are discarded.
+        """
+        self.__dict__.pop("_config", None)
     
     def _load_config(self) -> Dict[str, Any]:
         """Load config from file or return defaults if file doesn't exist"""
-        config = self.DEFAULT_CONFIG.copy()
+        config = copy.deepcopy(self.DEFAULT_CONFIG)
         
-        if self._config_path.exists():
-            with open(self._config_path, 'r') as f:
-                file_config = yaml.safe_load(f) or {}
-                config.update(file_config)
+        try:
+            mtime_ns = self._config_path.stat().st_mtime_ns
+        except OSError:
+            pass
+        else:
+            file_config = _read_config_file(str(self._config_path), mtime_ns)
+            config.update(copy.deepcopy(file_config))
         
         # Apply environment variable overrides
         if "TASKNOTE_GIT_BRANCH" in os.environ:
@@ -55,15 +137,41 @@ class Config:
     def save(self):
         """Save current config to file"""
         with open(self._config_path, 'w') as f:
-            yaml.safe_dump(self._config, f)
+            yaml.dump(self._config, f, Dumper=_YamlDumper)
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """Defer saves requested by set() until the block exits.
+        
+        The config file is written at most once, when the outermost block
+        exits without an exception.
+        
+        Example:
+            with config.batch():
+                config.set('git.user_name', name, save=True)
+                config.set('git.user_email', email, save=True)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            # Don't let a later batch write the changes of this aborted one
+            if self._batch_depth == 1:
+                self._save_pending = False
+            raise
+        finally:
+            self._batch_depth -= 1
+        
+        if self._batch_depth == 0 and self._save_pending:
+            self._save_pending = False
+            self.save()
     
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         """Get config value by dot notation key (e.g. 'git.branch_name')"""
-        keys = key.split('.')
         value = self._config
         
         try:
-            for k in keys:
+            for k in _split_key(key):
                 value = value[k]
             return value
         except (KeyError, TypeError):
@@ -71,7 +179,7 @@ class Config:
     
     def set(self, key: str, value: Any, save: bool = False):
         """Set config value by dot notation key"""
-        keys = key.split('.')
+        keys = _split_key(key)
         current = self._config
         
         for k in keys[:-1]:
@@ -82,7 +190,10 @@ class Config:
         current[keys[-1]] = value
         
         if save:
-            self.save()
+            if self._batch_depth:
+                self._save_pending = True
+            else:
+                self.save()
 
 # Global config instance
 config = Config()
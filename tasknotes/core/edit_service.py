@@ -3,12 +3,17 @@
 This module provides the EditService class for managing file editing sessions.
 """
 
-from typing import Dict, Optional
+import os
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple, Union
 from pathlib import Path
 
 from .edit_session_ot import EditSessionOT
 from ..interface import EditSession, FileService
 
+# Maximum number of file contents kept by an EditService
+CONTENT_CACHE_SIZE = 32
+
 
 def new_edit_service(filename: str, context: str, session_id: Optional[str] = None) -> EditSession:
     """create an edit service for the given file.
@@ -41,8 +46,50 @@ class EditService:
         """
         self.file_service = file_service
         self._sessions: Dict[str, EditSession] = {}
+        # File contents keyed by path, least recently used first. Each entry
+        # holds the backend's version token for the content.
+        self._content_cache: 'OrderedDict[str, Tuple[Hashable, str]]' = OrderedDict()
     
-    def create_session(self, filename: str, session_id: Optional[str] = None) -> EditSession:
+    def _cache_content(self, path: str, version: Optional[Hashable], content: str) -> None:
+        """Store file content in the content cache, evicting the oldest entry if full.
+        
+        Any content cached for an earlier version of the file is replaced.
+        Nothing is cached if the file service has no cheap version token.
+        
+        Args:
+            path: Path of the file relative to the storage root
+            version: The version token of the file, or None
+            content: The content of the file
+        """
+        if version is None:
+            return
+        self._content_cache[path] = (version, content)
+        self._content_cache.move_to_end(path)
+        if len(self._content_cache) > CONTENT_CACHE_SIZE:
+            self._content_cache.popitem(last=False)
+    
+    def _read_content(self, path: str) -> str:
+        """Read a file, reusing the cached content if it has not been modified.
+        
+        Args:
+            path: Path of the file relative to the storage root
+            
+        Returns:
+            str: The content of the file
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        version = self.file_service.get_file_version(path)
+        cached = self._content_cache.get(path)
+        if version is not None and cached is not None and cached[0] == version:
+            content = cached[1]
+        else:
+            content = self.file_service.read_file(path)
+        self._cache_content(path, version, content)
+        return content
+    
+    def create_session(self, filename: Union[str, os.PathLike], session_id: Optional[str] = None) -> EditSession:
         """Create a new edit session for a file.
         
         Args:
@@ -55,11 +102,12 @@ class EditService:
         Raises:
             FileNotFoundError: If the file doesn't exist
         """
-        path = Path(filename)
-        if not self.file_service.exists(path):
-            raise FileNotFoundError(f"File not found: {filename}")
+        path = Path(filename).as_posix()
+        try:
+            content = self._read_content(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {filename}") from None
             
-        content = self.file_service.read_file(path)
         session = new_edit_service(filename, content, session_id)
         self._sessions[session.session_id] = session
         return session
@@ -75,7 +123,7 @@ class EditService:
         """
         return self._sessions.get(session_id)
     
-    def save_session(self, session_id: str, filename: str) -> None:
+    def save_session(self, session_id: str, filename: Union[str, os.PathLike]) -> None:
         """Save the current content of an edit session to a file.
         
         Args:
@@ -89,8 +137,12 @@ class EditService:
         if session is None:
             raise KeyError(f"Session not found: {session_id}")
             
-        path = Path(filename)
-        self.file_service.write_file(path, session.get_content())
+        path = Path(filename).as_posix()
+        content = session.get_content()
+        self.file_service.write_file(path, content)
+        
+        # Write through to the cache so reopening the file doesn't read it back
+        self._cache_content(path, self.file_service.get_file_version(path), content)
     
     def close_session(self, session_id: str) -> None:
         """Close an edit session.
@@ -101,7 +153,5 @@ class EditService:
         Raises:
             KeyError: If the session doesn't exist
         """
-        if session_id not in self._sessions:
+        if self._sessions.pop(session_id, None) is None:
             raise KeyError(f"Session not found: {session_id}")
-            
-        del self._sessions[session_id]
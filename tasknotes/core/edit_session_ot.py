@@ -8,6 +8,10 @@ from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 import time
 from ..interface import EditSession, EditOperation
+from .rope import Rope
+
+# Consecutive edits made within this many seconds are merged in the history
+COMPOSE_WINDOW = 0.5
 
 
 @dataclass
@@ -74,6 +78,36 @@ class EditSessionOT(EditSession):
         """
         super().__init__(content, session_id)
         self.operations: List[Operation] = []
+        # Whether the last recorded operation may be extended by the next one
+        self._composable = False
+    
+    @property
+    def current_content(self) -> str:
+        """The current content, materialized from the rope and cached until the next edit."""
+        content = self._content
+        if content is None:
+            content = self._content = self._rope.to_str()
+        return content
+    
+    @current_content.setter
+    def current_content(self, content: str) -> None:
+        self._rope = Rope.from_str(content)
+        self._content = content
+    
+    def updated_content(self, content: str, edit_count: int) -> "EditSessionOT":
+        """Replace the content after it was changed outside this session.
+        
+        Args:
+            content: The new content
+            edit_count: The edit count to continue from
+            
+        Returns:
+            EditSessionOT: This session
+        """
+        super().updated_content(content, edit_count)
+        # The next edit must not merge into one made before the replacement
+        self._composable = False
+        return self
     
     def _apply_operation(self, operation: Operation) -> None:
         """Apply an operation to the current content.
@@ -81,23 +115,37 @@ class EditSessionOT(EditSession):
         Args:
             operation: The operation to apply
         """
-        # Get content before and after the operation range
-        before = self.current_content[:operation.start]
-        after = self.current_content[operation.end:]
+        rope = self._rope
+        end = operation.end
         
-        # Apply the operation
-        if operation.text or not after.startswith(" "):
-            self.current_content = before + operation.text + after
-        else:
-            # If we're deleting and the next character is a space, skip it
-            self.current_content = before + after[1:]
+        # If we're deleting and the next character is a space, skip it
+        if not operation.text and rope.char_at(end) == " ":
+            end += 1
+        
+        # Apply the operation to the rope, which copies only the edited path
+        # instead of the whole document. The content string is rebuilt on demand.
+        self._rope = rope.splice(operation.start, end, operation.text)
+        self._content = None
         
         # Update the length of the operation to reflect the new content length
-        operation.length = len(self.current_content)
+        operation.length = len(self._rope)
         
-        # Record the operation
-        self.operations.append(operation)
-        self.last_modified = time.time()
+        # Record the operation, merging it into the previous one when it
+        # continues it, so a run of typing is a single history entry. A delete
+        # that also skipped a space removed more than its recorded range, so
+        # it is never merged with a neighbour.
+        now = time.time()
+        operations = self.operations
+        exact = end == operation.end
+        composed = None
+        if exact and self._composable and now - self.last_modified < COMPOSE_WINDOW:
+            composed = _compose(operations[-1], operation)
+        if composed is None:
+            operations.append(operation)
+        else:
+            operations[-1] = composed
+        self._composable = exact
+        self.last_modified = now
         
         # 增加修改计数
         self._edit_count += 1
@@ -115,7 +163,7 @@ class EditSessionOT(EditSession):
         Raises:
             ValueError: If the position is invalid
         """
-        if position < 0 or position > len(self.current_content):
+        if position < 0 or position > len(self._rope):
             raise ValueError(f"Invalid position: {position}")
         
         operation = Operation(start=position, end=position, text=text)
@@ -142,9 +190,9 @@ class EditSessionOT(EditSession):
         Raises:
             ValueError: If the positions are invalid
         """
-        if start < 0 or start >= len(self.current_content):
+        if start < 0 or start >= len(self._rope):
             raise ValueError(f"Invalid start position: {start}")
-        if end <= start or end > len(self.current_content):
+        if end <= start or end > len(self._rope):
             raise ValueError(f"Invalid end position: {end}")
         
         operation = Operation(start=start, end=end, text="")
@@ -172,9 +220,9 @@ class EditSessionOT(EditSession):
         Raises:
             ValueError: If the positions are invalid
         """
-        if start < 0 or start >= len(self.current_content):
+        if start < 0 or start >= len(self._rope):
             raise ValueError(f"Invalid start position: {start}")
-        if end <= start or end > len(self.current_content):
+        if end <= start or end > len(self._rope):
             raise ValueError(f"Invalid end position: {end}")
         
         operation = Operation(start=start, end=end, text=text)
@@ -204,3 +252,24 @@ class EditSessionOT(EditSession):
         ]
     
 
+
+def _compose(last: Operation, operation: Operation) -> Optional[Operation]:
+    """Merge an operation into the operation applied just before it.
+    
+    An insert continuing the previous insert and a delete ending where the
+    previous delete started (e.g. repeated backspace) are merged into a single
+    operation with the same effect on the content the previous one was applied to.
+    
+    Args:
+        last: The previous operation
+        operation: The operation applied after it
+        
+    Returns:
+        Optional[Operation]: The merged operation, or None if they can't be merged
+    """
+    if last.start == last.end and operation.start == operation.end:
+        if last.text and operation.start == last.start + len(last.text):
+            return Operation(last.start, last.start, last.text + operation.text, operation.length)
+    elif not last.text and not operation.text and operation.end == last.start:
+        return Operation(operation.start, last.end, "", operation.length)
+    return None
@@ -615,6 +615,37 @@ class GitRepoTree(FileService):
         return last_commit_time
 
     
+    def get_file_version(self, path: str) -> pygit2.Oid:
+        """Get a token identifying the current content of a file.
+        
+        Args:
+            path: Path to the file relative to the storage root
+            
+        Returns:
+            pygit2.Oid: The id of the file's blob, which changes with its content
+            
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        # Use the transaction tree if in a transaction
+        current_tree = self._get_current_tree()
+        path_parts = path.split('/')
+        
+        try:
+            for part in path_parts[:-1]:
+                entry = current_tree[part]
+                if not isinstance(entry, pygit2.Tree):
+                    raise FileNotFoundError(f"Path component is not a directory: {part}")
+                current_tree = entry
+            
+            blob = current_tree[path_parts[-1]]
+        except KeyError:
+            raise FileNotFoundError(f"File not found: {path}")
+        
+        if not isinstance(blob, pygit2.Blob):
+            raise FileNotFoundError(f"Path is not a file: {path}")
+        return blob.id
+    
     def rename(self, old_path: str, new_path: str) -> None:
         """Rename a file or move it to a new location.
         
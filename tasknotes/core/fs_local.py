@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any, BinaryIO, Set, Iterator
+from typing import List, Optional, Dict, Any, BinaryIO, Set, Iterator, Tuple
 
 from tasknotes.interface.file_service import FileService
 from .task_env import TaskNoteEnv
@@ -59,8 +59,14 @@ class LocalFilesystem(FileService):
             IOError: If the file cannot be written
         """
         full_path = self._get_full_path(path)
-        os.makedirs(full_path.parent, exist_ok=True)
-        with open(full_path, "w", encoding="utf-8") as f:
+        try:
+            f = open(full_path, "w", encoding="utf-8")
+        except FileNotFoundError:
+            # Create the parent directories only when they are missing, so
+            # writes into existing directories skip the makedirs syscalls
+            os.makedirs(full_path.parent, exist_ok=True)
+            f = open(full_path, "w", encoding="utf-8")
+        with f:
             f.write(content)
     
     def delete_file(self, path: str) -> None:
@@ -142,6 +148,26 @@ class LocalFilesystem(FileService):
         
         return full_path.stat().st_mtime
     
+    def get_file_version(self, path: str) -> Tuple[int, int]:
+        """Get a token identifying the current content of a file.
+        
+        Args:
+            path: Path to the file relative to the storage root
+            
+        Returns:
+            Tuple[int, int]: The modified time in nanoseconds and the size of the file
+            
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        # A single stat; the size catches rewrites within the timestamp resolution
+        try:
+            stat = self._get_full_path(path).stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+        
+        return stat.st_mtime_ns, stat.st_size
+    
     def rename(self, old_path: str, new_path: str) -> None:
         """Rename a file or move it to a new location.
         
@@ -0,0 +1,298 @@
+"""Rope data structure for TaskNotes edit sessions.
+
+This module provides the Rope class, an immutable balanced binary tree of
+string chunks. Editing a rope copies only the path from the root to the
+edited leaves, so an edit costs O(log N + leaf size) instead of a copy of the
+whole document.
+"""
+
+from typing import List, Optional, Tuple
+
+# Maximum length of a leaf created when building a rope from a string
+LEAF_SIZE = 1024
+
+# Leaves edited in place may grow up to this length before being split
+MAX_LEAF_SIZE = 2 * LEAF_SIZE
+
+
+class Rope:
+    """An immutable rope of text.
+    
+    A rope is either a leaf holding a chunk of text, or an internal node
+    joining two ropes. Internal nodes are kept height-balanced (as in an AVL
+    tree). All operations return new ropes that share unchanged subtrees with
+    the original.
+    """
+    
+    __slots__ = ("left", "right", "text", "length", "height")
+    
+    def __init__(self, left: Optional["Rope"] = None, right: Optional["Rope"] = None,
+                 text: Optional[str] = None):
+        """Initialize a rope node. Use Rope.from_str to build a rope from text.
+        
+        Args:
+            left: Left subtree of an internal node
+            right: Right subtree of an internal node
+            text: Text of a leaf
+        """
+        self.left = left
+        self.right = right
+        self.text = text
+        if text is not None:
+            self.length = len(text)
+            self.height = 0
+        else:
+            self.length = left.length + right.length
+            self.height = max(left.height, right.height) + 1
+    
+    @classmethod
+    def from_str(cls, text: str) -> "Rope":
+        """Build a balanced rope from a string.
+        
+        Args:
+            text: The text of the rope
+        
+        Returns:
+            Rope: A rope holding the text in leaves of at most LEAF_SIZE characters
+        """
+        if len(text) <= LEAF_SIZE:
+            return cls(text=text)
+        
+        chunks = [cls(text=text[i:i + LEAF_SIZE]) for i in range(0, len(text), LEAF_SIZE)]
+        return _build(chunks, 0, len(chunks))
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __str__(self) -> str:
+        return self.to_str()
+    
+    def to_str(self) -> str:
+        """Materialize the rope as a string.
+        
+        Returns:
+            str: The text of the rope
+        """
+        if self.text is not None:
+            return self.text
+        
+        # Collect the leaves in order without recursion
+        parts: List[str] = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.text is not None:
+                parts.append(node.text)
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+        return "".join(parts)
+    
+    def char_at(self, position: int) -> str:
+        """Get the character at a position.
+        
+        Args:
+            position: Position of the character
+        
+        Returns:
+            str: The character, or an empty string if the position is past the end
+        """
+        if position < 0 or position >= self.length:
+            return ""
+        
+        node = self
+        while node.text is None:
+            left_length = node.left.length
+            if position < left_length:
+                node = node.left
+            else:
+                position -= left_length
+                node = node.right
+        return node.text[position]
+    
+    def slice(self, start: int, end: int) -> str:
+        """Get the text between two positions.
+        
+        Args:
+            start: Start position
+            end: End position
+        
+        Returns:
+            str: The text between start and end
+        """
+        start = max(start, 0)
+        end = min(end, self.length)
+        if start >= end:
+            return ""
+        
+        parts: List[str] = []
+        _collect(self, start, end, parts)
+        return "".join(parts)
+    
+    def concat(self, other: "Rope") -> "Rope":
+        """Join this rope with another one.
+        
+        Args:
+            other: The rope to append
+        
+        Returns:
+            Rope: A rope holding the text of this rope followed by the other one
+        """
+        return _join(self, other)
+    
+    def split(self, position: int) -> Tuple["Rope", "Rope"]:
+        """Split the rope at a position.
+        
+        Args:
+            position: Position to split at
+        
+        Returns:
+            Tuple[Rope, Rope]: The ropes before and after the position
+        """
+        return _split(self, min(max(position, 0), self.length))
+    
+    def splice(self, start: int, end: int, text: str) -> "Rope":
+        """Replace the text between two positions.
+        
+        Args:
+            start: Start position
+            end: End position
+            text: Replacement text
+        
+        Returns:
+            Rope: The edited rope
+        """
+        start = min(max(start, 0), self.length)
+        end = min(max(end, start), self.length)
+        
+        # Edits within a single leaf rewrite only that leaf
+        if len(text) <= LEAF_SIZE:
+            edited = _splice_leaf(self, start, end, text)
+            if edited is not None:
+                return edited
+        
+        left, rest = _split(self, start)
+        _, right = _split(rest, end - start)
+        return _join(_join(left, Rope.from_str(text)), right)
+    
+    def insert(self, position: int, text: str) -> "Rope":
+        """Insert text at a position.
+        
+        Args:
+            position: Position to insert at
+            text: Text to insert
+        
+        Returns:
+            Rope: The edited rope
+        """
+        return self.splice(position, position, text)
+    
+    def delete(self, start: int, end: int) -> "Rope":
+        """Delete the text between two positions.
+        
+        Args:
+            start: Start position
+            end: End position
+        
+        Returns:
+            Rope: The edited rope
+        """
+        return self.splice(start, end, "")
+
+
+def _build(leaves: List[Rope], start: int, end: int) -> Rope:
+    """Build a balanced rope from a range of leaves."""
+    if end - start == 1:
+        return leaves[start]
+    middle = (start + end) // 2
+    return Rope(_build(leaves, start, middle), _build(leaves, middle, end))
+
+
+def _collect(node: Rope, start: int, end: int, parts: List[str]) -> None:
+    """Append the text of a rope between two positions to a list of parts."""
+    if node.text is not None:
+        parts.append(node.text[start:end])
+        return
+    
+    left_length = node.left.length
+    if start < left_length:
+        _collect(node.left, start, min(end, left_length), parts)
+    if end > left_length:
+        _collect(node.right, max(start - left_length, 0), end - left_length, parts)
+
+
+def _balance(left: Rope, right: Rope) -> Rope:
+    """Join two ropes whose heights differ by at most two, rotating if needed."""
+    if left.height > right.height + 1:
+        if left.left.height >= left.right.height:
+            return Rope(left.left, Rope(left.right, right))
+        inner = left.right
+        return Rope(Rope(left.left, inner.left), Rope(inner.right, right))
+    
+    if right.height > left.height + 1:
+        if right.right.height >= right.left.height:
+            return Rope(Rope(left, right.left), right.right)
+        inner = right.left
+        return Rope(Rope(left, inner.left), Rope(inner.right, right.right))
+    
+    return Rope(left, right)
+
+
+def _join(left: Rope, right: Rope) -> Rope:
+    """Join two ropes of any height into a balanced rope."""
+    if not left.length:
+        return right
+    if not right.length:
+        return left
+    
+    # Merge small leaves so repeated edits don't fragment the rope
+    if left.text is not None and right.text is not None and left.length + right.length <= LEAF_SIZE:
+        return Rope(text=left.text + right.text)
+    
+    if left.height > right.height + 1:
+        return _balance(left.left, _join(left.right, right))
+    if right.height > left.height + 1:
+        return _balance(_join(left, right.left), right.right)
+    return Rope(left, right)
+
+
+def _split(node: Rope, position: int) -> Tuple[Rope, Rope]:
+    """Split a rope at a position within its bounds."""
+    if node.text is not None:
+        return Rope(text=node.text[:position]), Rope(text=node.text[position:])
+    
+    left_length = node.left.length
+    if position < left_length:
+        left, right = _split(node.left, position)
+        return left, _join(right, node.right)
+    if position > left_length:
+        left, right = _split(node.right, position - left_length)
+        return _join(node.left, left), right
+    return node.left, node.right
+
+
+def _splice_leaf(node: Rope, start: int, end: int, text: str) -> Optional[Rope]:
+    """Replace text within a single leaf, copying only the path to it.
+    
+    Returns:
+        Optional[Rope]: The edited rope, or None if the range spans several leaves
+    """
+    if node.text is not None:
+        edited = node.text[:start] + text + node.text[end:]
+        if not edited:
+            # Let the caller drop the leaf instead of keeping an empty one
+            return None
+        if len(edited) <= MAX_LEAF_SIZE:
+            return Rope(text=edited)
+        # Split the grown leaf, which raises the height by at most one
+        middle = len(edited) // 2
+        return Rope(Rope(text=edited[:middle]), Rope(text=edited[middle:]))
+    
+    left_length = node.left.length
+    if end <= left_length:
+        left = _splice_leaf(node.left, start, end, text)
+        return None if left is None else _balance(left, node.right)
+    if start >= left_length:
+        right = _splice_leaf(node.right, start - left_length, end - left_length, text)
+        return None if right is None else _balance(node.left, right)
+    return None
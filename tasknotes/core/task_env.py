@@ -1,5 +1,6 @@
 """Git integration for TaskNotes."""
 
+import functools
 import os
 import subprocess
 from typing import List, Optional, Tuple, Dict, Any, Literal, Union
@@ -82,7 +83,7 @@ class TaskNoteEnv:
         if not self.is_git_repo():
             return False
             
-        branch_name = config.get("git.branch_name")
+        branch_name = config.git_branch_name
         # In pygit2, branches is a dictionary-like object with branch names as keys
         return branch_name in self._repo.branches
     
@@ -93,7 +94,7 @@ class TaskNoteEnv:
             bool: True if TaskNotes has been initialized, False otherwise
         """
         # Check for LOCAL mode - .tasknote directory
-        tasknote_dir = self.repo_path / config.get("local.task_dir")
+        tasknote_dir = self.repo_path / config.local_task_dir
         if tasknote_dir.exists() and tasknote_dir.is_dir():
             return True
         
@@ -103,6 +104,24 @@ class TaskNoteEnv:
         
         return False
     
+    @functools.cached_property
+    def mode(self) -> Optional[Literal["LOCAL", "GIT"]]:
+        """The mode TaskNotes has been initialized in.
+        
+        The repository and the filesystem are probed on first access only;
+        tasknote_init() resets the cached value.
+        
+        Returns:
+            Optional[Literal["LOCAL", "GIT"]]: "GIT" if the repository has a tasknote
+            branch, "LOCAL" if only the TaskNotes directory exists, None if
+            TaskNotes has not been initialized
+        """
+        if self.has_tasknote_branch():
+            return "GIT"
+        if (self.repo_path / config.local_task_dir).is_dir():
+            return "LOCAL"
+        return None
+    
     def _get_user_signature(self) -> pygit2.Signature:
         """Get a signature for the current user from git config.
         
@@ -110,8 +129,8 @@ class TaskNoteEnv:
             pygit2.Signature: Signature with user name and email
         """
         # Default values
-        user_name = config.get("git.user_name")
-        user_email = config.get("git.user_email")
+        user_name = config.git_user_name
+        user_email = config.git_user_email
         
         if self._repo is not None:
             try:
@@ -184,9 +203,10 @@ class TaskNoteEnv:
         # Initialize based on mode
         if mode == "LOCAL":
             # Create .tasknote directory
-            tasknote_dir = self.repo_path / config.get("local.task_dir")
+            tasknote_dir = self.repo_path / config.local_task_dir
             try:
                 tasknote_dir.mkdir(exist_ok=True)
+                self.__dict__.pop("mode", None)
                 return True, ""
             except Exception as e:
                 error_msg = f"Error creating TaskNotes directory: {str(e)}"
@@ -213,7 +233,7 @@ class TaskNoteEnv:
                     pass
                     
                 # Create the commit on a new branch directly
-                branch_name = config.get("git.branch_name")
+                branch_name = config.git_branch_name
                 reference_name = f"refs/heads/{branch_name}"
                 
                 # Create the commit
@@ -226,6 +246,7 @@ class TaskNoteEnv:
                     parent_commits
                 )
                 
+                self.__dict__.pop("mode", None)
                 return True, ""
             except Exception as e:
                 error_msg = f"Error initializing TaskNotes in GIT mode: {str(e)}"
@@ -263,5 +284,5 @@ def find_file_service(path: str, env: Optional[TaskNoteEnv] = None) -> Optional[
     
     from .fs_local import LocalFilesystem
     # Use LocalFilesystem as fallback, with the correct path to the task directory
-    task_dir_path = Path(path) / config.get("local.task_dir")
+    task_dir_path = Path(path) / config.local_task_dir
     return LocalFilesystem(task_dir_path)
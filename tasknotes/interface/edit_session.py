@@ -56,7 +56,7 @@ class EditSession(ABC):
         return self._session_id
 
     @abstractmethod
-    def updated_content(self, content: str, edit_count: int) -> EditSession:
+    def updated_content(self, content: str, edit_count: int) -> "EditSession":
         self.current_content = content
         self._edit_count = edit_count
 
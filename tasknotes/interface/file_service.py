@@ -10,7 +10,7 @@ import shutil
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any, BinaryIO, Set, Iterator, Generator, ContextManager
+from typing import List, Optional, Dict, Any, BinaryIO, Set, Iterator, Generator, ContextManager, Hashable
 
 
 class FileService(ABC):
@@ -112,6 +112,25 @@ class FileService(ABC):
         """
         pass
     
+    def get_file_version(self, path: str) -> Optional[Hashable]:
+        """Get a cheap token identifying the current content of a file.
+        
+        The token must change whenever the content changes, and must be
+        cheaper to get than reading the file. Callers use it to reuse content
+        they have already read.
+        
+        Args:
+            path: Path to the file relative to the storage root
+            
+        Returns:
+            Optional[Hashable]: The version token, or None if the backend
+            cannot supply one cheaply (the default)
+            
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        return None
+    
     @abstractmethod
     def rename(self, old_path: str, new_path: str) -> None:
         """Rename a file or move it to a new location.
@@ -0,0 +1,41 @@
+"""Tests for BaseCmd and CmdResult."""
+
+import copy
+import json
+import pickle
+import unittest
+
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult
+
+
+class EchoCmd(BaseCmd):
+    def _execute_impl(self, cmd_service, task_env):
+        return CmdResult(True, "ok", {"echo": self.args.get("text")})
+
+
+class TestCmdResult(unittest.TestCase):
+    def setUp(self):
+        self.cmd = EchoCmd("echo", {"text": "hi", "tag": ["a"]})
+        self.result = self.cmd.execute(None, None)
+
+    def test_command_info(self):
+        self.assertEqual(self.result.command, "echo")
+        self.assertEqual(self.result.command_args, {"text": "hi", "tag": ["a"]})
+        self.assertEqual(self.result.to_json()["command_args"], {"text": "hi", "tag": ["a"]})
+
+    def test_command_args_is_a_snapshot(self):
+        self.cmd.args["text"] = "changed"
+        self.assertEqual(self.result.command_args["text"], "hi")
+
+    def test_str_is_indented_json(self):
+        result = CmdResult(True, "héllo", {"tags": ["ünïcode"]})
+        self.assertEqual(str(result), json.dumps(result.to_json(), indent=2))
+        self.assertEqual(str(self.cmd), json.dumps(self.cmd.to_json(), indent=2))
+
+    def test_copy_and_pickle(self):
+        self.assertEqual(copy.deepcopy(self.result), self.result)
+        self.assertEqual(pickle.loads(pickle.dumps(self.result)), self.result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""Tests for the TaskNotes CLI daemon."""
+
+import io
+import os
+import shutil
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pygit2
+
+from tasknotes.cli import daemon
+
+
+class TestRunInvocation(unittest.TestCase):
+    def setUp(self):
+        self.cwd = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cwd)
+
+    def run_with_main(self, fake_main, argv=(), env=None):
+        with mock.patch('tasknotes.cli.main.main', fake_main):
+            return daemon.run_invocation(list(argv), self.cwd, env)
+
+    def test_captures_output_and_exit_code(self):
+        def fake_main(argv, task_env=None):
+            print('out', argv, os.getcwd() == os.path.realpath(self.cwd))
+            print('err', file=sys.stderr)
+            sys.exit(3)
+
+        response = self.run_with_main(fake_main, ['list'])
+        self.assertEqual(response, {'stdout': "out ['list'] True\n", 'stderr': 'err\n', 'exit_code': 3})
+
+    def test_exception_is_reported(self):
+        def fake_main(argv, task_env=None):
+            raise TypeError('boom')
+
+        response = self.run_with_main(fake_main)
+        self.assertEqual(response['exit_code'], 1)
+        self.assertIn('TypeError: boom', response['stderr'])
+
+    def test_client_env_is_applied(self):
+        from tasknotes.cli import main as cli_main
+
+        seen = {}
+
+        def fake_main(argv, task_env=None):
+            seen['debug'] = cli_main.is_debug_mode()
+            seen['env'] = os.environ.get('TASKNOTE_CLI_DEBUG')
+
+        with mock.patch.dict(os.environ, {'TASKNOTE_CLI_DEBUG': ''}):
+            cli_main.load_env_settings()
+            self.run_with_main(fake_main, env={'TASKNOTE_CLI_DEBUG': '1', 'OTHER': 'x'})
+            self.assertEqual(seen, {'debug': True, 'env': '1'})
+            self.assertEqual(os.environ['TASKNOTE_CLI_DEBUG'], '')
+            self.assertNotIn('OTHER', os.environ)
+            self.assertFalse(cli_main.is_debug_mode())
+
+    def test_task_env_is_cached(self):
+        envs = []
+
+        def fake_main(argv, task_env=None):
+            envs.append(task_env)
+            task_env.mode
+
+        pygit2.init_repository(self.cwd)
+        with mock.patch.dict(daemon._task_envs, clear=True):
+            self.run_with_main(fake_main)
+            self.assertIsNone(envs[0].mode)
+            os.mkdir(os.path.join(self.cwd, '.tasknote'))
+            self.run_with_main(fake_main)
+
+        self.assertEqual(envs[0].repo_path, Path(self.cwd).resolve())
+        self.assertIs(envs[1], envs[0])
+        # The mode is probed again for each request
+        self.assertEqual(envs[1].mode, 'LOCAL')
+
+
+class TestForward(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.socket_path = os.path.join(self.tmpdir, 'daemon.sock')
+
+    def test_should_forward(self):
+        self.assertTrue(daemon.should_forward(['list', '--status', 'open']))
+        self.assertFalse(daemon.should_forward(['note', '1', '-f', '-']))
+
+    def test_forward_without_daemon(self):
+        self.assertIsNone(daemon.forward(self.socket_path, ['list']))
+
+    def test_forward_round_trip(self):
+        requests = []
+
+        def fake_run_invocation(argv, cwd, env=None):
+            requests.append((argv, cwd, env))
+            return {'stdout': 'listed\n', 'stderr': '', 'exit_code': 2}
+
+        server = socketserver.UnixStreamServer(self.socket_path, daemon._InvocationHandler)
+        self.addCleanup(server.server_close)
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+
+        stdout = io.StringIO()
+        with mock.patch.object(daemon, 'run_invocation', fake_run_invocation), \
+                mock.patch.dict(os.environ, {'TASKNOTE_NO_RICH': '1'}), \
+                mock.patch('sys.stdout', stdout):
+            exit_code = daemon.forward(self.socket_path, ['list'])
+        thread.join()
+
+        self.assertEqual(exit_code, 2)
+        self.assertEqual(stdout.getvalue(), 'listed\n')
+        argv, cwd, env = requests[0]
+        self.assertEqual(argv, ['list'])
+        self.assertEqual(cwd, os.getcwd())
+        self.assertEqual(env.get('TASKNOTE_NO_RICH'), '1')
+
+    def test_forward_without_reply(self):
+        # A daemon that dies after reading the request may have run it
+        server = socketserver.UnixStreamServer(self.socket_path, socketserver.StreamRequestHandler)
+        self.addCleanup(server.server_close)
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+
+        stderr = io.StringIO()
+        with mock.patch('sys.stderr', stderr):
+            exit_code = daemon.forward(self.socket_path, ['list'])
+        thread.join()
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn('no reply from the TaskNotes daemon', stderr.getvalue())
+
+    def test_serve_creates_private_socket(self):
+        created = threading.Event()
+
+        def fake_serve_forever(server):
+            created.set()
+            self.mode = stat.S_IMODE(os.stat(self.socket_path).st_mode)
+            raise KeyboardInterrupt
+
+        with mock.patch.object(socketserver.UnixStreamServer, 'serve_forever', fake_serve_forever):
+            daemon.serve(self.socket_path)
+
+        self.assertTrue(created.is_set())
+        self.assertEqual(self.mode, 0o600)
+        self.assertFalse(os.path.exists(self.socket_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
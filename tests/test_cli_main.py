@@ -0,0 +1,74 @@
+"""Tests for the TaskNotes CLI entry point."""
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import re
+import sys
+import unittest
+from unittest import mock
+
+
+PYPROJECT = os.path.join(os.path.dirname(__file__), '..', 'pyproject.toml')
+
+
+class TestCliEntryPoint(unittest.TestCase):
+    def setUp(self):
+        with open(PYPROJECT, encoding='utf-8') as f:
+            content = f.read()
+        section = content.split('[project.scripts]', 1)[1].split('\n[', 1)[0]
+        self.scripts = dict(re.findall(r'^(\S+)\s*=\s*"([^"]+)"', section, re.M))
+
+    def test_single_script_entry(self):
+        self.assertEqual(self.scripts, {'tasknotes': 'tasknotes.cli.main:main'})
+
+    def test_entry_point_resolves(self):
+        module_name, attr = self.scripts['tasknotes'].split(':')
+        module = importlib.import_module(module_name)
+        self.assertTrue(callable(getattr(module, attr)))
+
+        importlib.import_module('tasknotes.cli')
+        cli_mains = [name for name in sys.modules if name.startswith('tasknotes.cli') and name.endswith('main')]
+        self.assertEqual(cli_mains, ['tasknotes.cli.main'])
+
+
+class TestHelpCommand(unittest.TestCase):
+    def run_main(self, argv):
+        from tasknotes.cli import main as cli_main
+
+        stdout = io.StringIO()
+        with mock.patch.object(cli_main, 'DEBUG_MODE', True), contextlib.redirect_stdout(stdout):
+            cli_main.main(argv)
+        return json.loads(stdout.getvalue())
+
+    def test_help_without_topic(self):
+        cmd = self.run_main(['help'])
+        self.assertEqual(cmd['command'], 'help')
+        self.assertIsNone(cmd['args']['topic'])
+
+    def test_help_with_topic(self):
+        cmd = self.run_main(['help', 'list'])
+        self.assertEqual(cmd['command'], 'help')
+        self.assertEqual(cmd['args']['topic'], 'list')
+
+    def test_help_cmd_topic(self):
+        from tasknotes.cmds.cmd_help import HelpCmd
+
+        result = HelpCmd('help', {'topic': 'list'}).execute(None, None)
+        self.assertTrue(result.success)
+        self.assertEqual(result.data['command'], 'list')
+
+        result = HelpCmd('help', {'topic': None}).execute(None, None)
+        self.assertTrue(result.success)
+        self.assertIn('commands', result.data)
+
+    def test_create_from_args_without_command(self):
+        from tasknotes.cmds.cmd_factory import cmd_factory
+
+        self.assertIsNone(cmd_factory.create_from_args(None, mock.Mock()))
+
+
+if __name__ == '__main__':
+    unittest.main()
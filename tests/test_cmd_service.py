@@ -0,0 +1,50 @@
+"""Tests for the CmdService class."""
+
+import io
+import json
+import unittest
+
+from tasknotes.cmds.base_cmd import BaseCmd, CmdResult
+from tasknotes.cmds.cmd_service import CmdService
+
+
+class EchoCmd(BaseCmd):
+    def _execute_impl(self, cmd_service, task_env):
+        return CmdResult(True, "héllo", {"echo": self.args.get("text"), "lines": "a\nb", "empty": []})
+
+
+class LabelledCmd(EchoCmd):
+    def to_json(self):
+        data = super().to_json()
+        data["label"] = "custom"
+        return data
+
+
+class TestCmdServiceJson(unittest.TestCase):
+    def setUp(self):
+        self.service = CmdService(task_env=object())
+
+    def assertDumpMatches(self):
+        expected = json.dumps(self.service.to_json(), indent=2)
+        self.assertEqual(str(self.service), expected)
+        buffer = io.StringIO()
+        self.service.dump(buffer)
+        self.assertEqual(buffer.getvalue(), expected)
+
+    def test_empty(self):
+        self.assertDumpMatches()
+
+    def test_queued_and_executed(self):
+        self.service.add_cmd(EchoCmd("echo", {"text": "ünïcode"}, stdin=io.StringIO("in")))
+        self.service.add_cmd(LabelledCmd("echo", {"text": "two"}))
+        self.service.execute_all()
+        self.service.add_cmd(LabelledCmd("echo", {}))
+        self.assertDumpMatches()
+
+        # Subclass overrides of to_json() are used
+        self.assertEqual(self.service.to_json()["queue"][0]["label"], "custom")
+        self.assertIn('"label": "custom"', str(self.service))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Tests for the Config class."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from tasknotes.core.config import Config
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = Path(self.temp_dir.name) / "config.yml"
+        self.config = Config(self.path)
+
+    def write_file(self, data, mtime_ns):
+        """Write the config file and pin its modified time."""
+        self.path.write_text(yaml.safe_dump(data))
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_config_is_loaded_lazily(self):
+        with mock.patch.object(Config, "_load_config", autospec=True, side_effect=Config._load_config) as load:
+            config = Config(self.path)
+            load.assert_not_called()
+            self.assertEqual(config.get("git.branch_name"), "tasknote")
+            self.assertEqual(config.git_branch_name, "tasknote")
+            config.get("local.task_dir")
+            load.assert_called_once()
+
+    def test_accessors(self):
+        self.write_file({"git": {"branch_name": "notes"}}, 1_000_000_000)
+        self.assertEqual(self.config.git_branch_name, "notes")
+        self.assertIsNone(self.config.git_user_name)
+        self.assertEqual(self.config.local_task_dir, ".tasknote")
+        self.assertEqual(self.config.get("git.missing", "default"), "default")
+
+    def test_reload(self):
+        self.write_file({"git": {"branch_name": "one"}}, 1_000_000_000)
+        self.assertEqual(self.config.git_branch_name, "one")
+
+        # Unsaved changes are discarded and file changes are picked up
+        self.config.set("git.user_name", "changed")
+        self.write_file({"git": {"branch_name": "two"}}, 2_000_000_000)
+        self.config.reload()
+        self.assertEqual(self.config.git_branch_name, "two")
+        self.assertIsNone(self.config.git_user_name)
+
+        # Environment overrides are applied again
+        with mock.patch.dict(os.environ, {"TASKNOTE_GIT_BRANCH": "env"}):
+            self.config.reload()
+            self.assertEqual(self.config.git_branch_name, "env")
+
+    def test_set_does_not_modify_parsed_file(self):
+        self.write_file({"git": {"branch_name": "one"}}, 1_000_000_000)
+        self.config.set("git.branch_name", "changed")
+        self.assertEqual(Config(self.path).git_branch_name, "one")
+
+    def test_batch_saves_once(self):
+        with mock.patch.object(self.config, "save", wraps=self.config.save) as save:
+            with self.config.batch():
+                self.config.set("git.user_name", "name", save=True)
+                with self.config.batch():
+                    self.config.set("git.user_email", "email", save=True)
+                save.assert_not_called()
+            save.assert_called_once()
+
+        saved = Config(self.path)
+        self.assertEqual((saved.git_user_name, saved.git_user_email), ("name", "email"))
+
+    def test_batch_without_save(self):
+        with self.config.batch():
+            self.config.set("git.user_name", "name")
+        self.assertFalse(self.path.exists())
+
+    def test_failed_batch_is_not_saved_later(self):
+        with self.assertRaises(RuntimeError):
+            with self.config.batch():
+                self.config.set("git.user_name", "name", save=True)
+                raise RuntimeError("abort")
+        self.assertFalse(self.path.exists())
+
+        with self.config.batch():
+            pass
+        self.assertFalse(self.path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Tests for the EditService class."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pygit2
+
+from tasknotes.core.edit_service import EditService
+from tasknotes.core.fs_git import GitRepoTree
+from tasknotes.core.fs_local import LocalFilesystem
+from tasknotes.core.task_env import TaskNoteEnv
+
+
+class TestContentCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.fs = LocalFilesystem(Path(self.temp_dir.name))
+        self.service = EditService(self.fs)
+
+    def write(self, name, content, mtime=1000.0):
+        """Write a file and pin its modified time."""
+        self.fs.write_file(name, content)
+        os.utime(Path(self.temp_dir.name) / name, (mtime, mtime))
+
+    def test_unchanged_file_is_not_read_again(self):
+        self.write("a.md", "one")
+        self.assertEqual(self.service.create_session(Path("a.md")).get_content(), "one")
+
+        with mock.patch.object(self.fs, "read_file", side_effect=AssertionError("read again")):
+            self.assertEqual(self.service.create_session("a.md").get_content(), "one")
+
+    def test_rewrite_with_same_modified_time(self):
+        self.write("a.md", "one")
+        self.service.create_session("a.md")
+
+        # A rewrite within the timestamp resolution is caught by the size
+        self.write("a.md", "three")
+        self.assertEqual(self.service.create_session("a.md").get_content(), "three")
+
+    def test_save_replaces_cached_version(self):
+        self.write("a.md", "one")
+        session = self.service.create_session("a.md")
+        session.insert(3, " two")
+        self.service.save_session(session.session_id, "a.md")
+
+        self.assertEqual(len(self.service._content_cache), 1)
+        with mock.patch.object(self.fs, "read_file", side_effect=AssertionError("read again")):
+            self.assertEqual(self.service.create_session("a.md").get_content(), "one two")
+
+
+class TestGitContentCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        repo = pygit2.init_repository(self.temp_dir.name)
+        author = pygit2.Signature("Test User", "test@example.com")
+        repo.create_commit("HEAD", author, author, "Initial commit", repo.TreeBuilder().write(), [])
+
+        env = TaskNoteEnv(self.temp_dir.name)
+        env.tasknote_init(mode="GIT")
+        self.fs = GitRepoTree(env)
+        self.service = EditService(self.fs)
+
+    def test_cache_uses_blob_id(self):
+        self.fs.write_file("notes/a.md", "one")
+        self.assertEqual(self.service.create_session(Path("notes/a.md")).get_content(), "one")
+
+        # A hit costs neither a read nor a walk of the commit history
+        with mock.patch.object(self.fs, "read_file", side_effect=AssertionError("read again")), \
+                mock.patch.object(self.fs, "get_modified_time", side_effect=AssertionError("history walked")):
+            self.assertEqual(self.service.create_session(Path("notes/a.md")).get_content(), "one")
+
+        # A rewrite of the same length in the same second is still seen
+        self.fs.write_file("notes/a.md", "two")
+        self.assertEqual(self.service.create_session("notes/a.md").get_content(), "two")
+
+    def test_cache_in_transaction(self):
+        self.fs.write_file("a.md", "one")
+        with self.fs.transaction("edit"):
+            session = self.service.create_session("a.md")
+            session.insert(3, "!")
+            self.service.save_session(session.session_id, Path("a.md"))
+            with mock.patch.object(self.fs, "read_file", side_effect=AssertionError("read again")):
+                self.assertEqual(self.service.create_session("a.md").get_content(), "one!")
+        self.assertEqual(self.fs.read_file("a.md"), "one!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -264,5 +264,51 @@ class TestEditSession(unittest.TestCase):
         self.assertEqual(session.created_at, initial_time)
         self.assertTrue(session.last_modified > initial_modified)
 
+    def test_operation_composition(self):
+        """Test that consecutive inserts and deletes are merged in the history."""
+        # Typing at consecutive positions becomes a single insert
+        for i, char in enumerate(", there"):
+            self.session.insert(5 + i, char)
+        self.assertEqual(self.session.get_content(), "Hello, there world!")
+        self.assertEqual(self.session.edit_count, 7)
+        history = self.session.get_edit_history()
+        self.assertEqual(history, [EditOperation(text=", there", start=5, end=5, length=19)])
+
+        # Repeated backspace becomes a single delete
+        session = new_edit_service("", "abcdefgh")
+        for position in (7, 6, 5):
+            session.delete(position, position + 1)
+        self.assertEqual(session.get_content(), "abcde")
+        self.assertEqual(session.get_edit_history(), [EditOperation(text="", start=5, end=8, length=5)])
+
+        # Deletes that also skip a following space remove more than their
+        # recorded range, so they are not merged
+        session = new_edit_service("", "a   ")
+        session.delete(1, 2)
+        session.delete(0, 1)
+        self.assertEqual(session.get_content(), "")
+        self.assertEqual(session.get_edit_history(), [
+            EditOperation(text="", start=1, end=2, length=2),
+            EditOperation(text="", start=0, end=1, length=0),
+        ])
+
+        # Edits are not merged across a content replacement
+        session = new_edit_service("", "abc")
+        session.insert(3, "x")
+        session.updated_content("QQQQ", 5)
+        session.insert(4, "z")
+        self.assertEqual(session.get_content(), "QQQQz")
+        self.assertEqual(session.get_edit_history(), [
+            EditOperation(text="x", start=3, end=3, length=4),
+            EditOperation(text="z", start=4, end=4, length=5),
+        ])
+
+        # Edits that don't continue each other are kept apart
+        session = new_edit_service("", "abc")
+        session.insert(0, "x")
+        session.insert(0, "y")
+        session.delete(0, 1)
+        self.assertEqual(len(session.get_edit_history()), 3)
+
 if __name__ == '__main__':
     unittest.main()
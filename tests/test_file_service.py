@@ -181,6 +181,21 @@ class FileServiceTestBase:
         current_time = time.time()
         self.assertLess(current_time - mtime, 10)  # Within 10 seconds
         self.assertGreater(mtime, current_time - 60)  # Not more than 60 seconds ago
+
+    def test_get_file_version(self):
+        """Test getting the version token of a file."""
+        # Test with a non-existent file
+        with self.assertRaises(FileNotFoundError):
+            self.fs.get_file_version("nonexistent.txt")
+
+        self.fs.write_file("dir/test.txt", "Hello")
+        version = self.fs.get_file_version("dir/test.txt")
+        self.assertIsNotNone(version)
+        self.assertEqual(self.fs.get_file_version("dir/test.txt"), version)
+
+        # A rewrite changes the version
+        self.fs.write_file("dir/test.txt", "Hello, world!")
+        self.assertNotEqual(self.fs.get_file_version("dir/test.txt"), version)
     
     def test_rename(self):
         """Test renaming files."""
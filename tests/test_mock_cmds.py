@@ -0,0 +1,38 @@
+"""Tests for the data returned by the commands backed by mock data."""
+
+import unittest
+
+from tasknotes.cmds.cmd_active import ActiveCmd
+from tasknotes.cmds.cmd_tag import TagCmd
+
+
+class TestActiveCmd(unittest.TestCase):
+    def test_results_do_not_share_tasks(self):
+        first = ActiveCmd("active", {}).execute(None, None)
+        first.data["active_tasks"][0]["tags"].append("changed")
+        first.data["active_tasks"][0]["tags_str"] = "changed"
+
+        second = ActiveCmd("active", {}).execute(None, None)
+        self.assertEqual(second.data["active_tasks"], [
+            {"id": "TASK-001", "title": "Implement CLI parsing", "status": "active", "tags": ["important", "urgent"]}
+        ])
+
+
+class TestTagCmd(unittest.TestCase):
+    def test_tags_are_lists(self):
+        result = TagCmd("tag", {"list": True}).execute(None, None)
+        self.assertEqual(result.data["tags"], ["important", "urgent", "bug", "documentation", "feature"])
+        result.data["tags"].append("changed")
+
+        result = TagCmd("tag", {"task": "TASK-001"}).execute(None, None)
+        self.assertEqual(result.data["tags"], ["important", "urgent"])
+        result.data["tags"].append("changed")
+
+        result = TagCmd("tag", {"list": True}).execute(None, None)
+        self.assertNotIn("changed", result.data["tags"])
+        result = TagCmd("tag", {"task": "TASK-001"}).execute(None, None)
+        self.assertNotIn("changed", result.data["tags"])
+
+
+if __name__ == "__main__":
+    unittest.main()
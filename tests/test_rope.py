@@ -0,0 +1,97 @@
+"""Tests for the Rope class."""
+
+import random
+import unittest
+
+from tasknotes.core.rope import LEAF_SIZE, Rope
+
+
+def check_balanced(rope: Rope) -> int:
+    """Check the rope's invariants and return its height."""
+    if rope.text is not None:
+        return 0
+    left_height = check_balanced(rope.left)
+    right_height = check_balanced(rope.right)
+    assert rope.left.length and rope.right.length, "internal node with an empty child"
+    assert abs(left_height - right_height) <= 1, "unbalanced node"
+    assert rope.length == rope.left.length + rope.right.length
+    return max(left_height, right_height) + 1
+
+
+class TestRope(unittest.TestCase):
+    def test_from_str(self):
+        """Test building ropes from short and long strings."""
+        self.assertEqual(Rope.from_str("").to_str(), "")
+        self.assertEqual(Rope.from_str("hello").to_str(), "hello")
+
+        text = "".join(chr(ord("a") + i % 26) for i in range(10 * LEAF_SIZE + 3))
+        rope = Rope.from_str(text)
+        self.assertEqual(len(rope), len(text))
+        self.assertEqual(str(rope), text)
+        check_balanced(rope)
+
+    def test_insert_delete(self):
+        """Test inserting and deleting text."""
+        rope = Rope.from_str("Hello world!")
+        rope = rope.insert(5, ",")
+        self.assertEqual(rope.to_str(), "Hello, world!")
+        rope = rope.delete(0, 7)
+        self.assertEqual(rope.to_str(), "world!")
+        rope = rope.splice(0, 5, "there")
+        self.assertEqual(rope.to_str(), "there!")
+
+    def test_immutable(self):
+        """Test that edits leave the original rope unchanged."""
+        text = "x" * (3 * LEAF_SIZE)
+        rope = Rope.from_str(text)
+        rope.insert(LEAF_SIZE, "y")
+        rope.delete(10, 2 * LEAF_SIZE)
+        self.assertEqual(rope.to_str(), text)
+
+    def test_char_at_and_slice(self):
+        """Test reading characters and ranges."""
+        text = "".join(str(i % 10) for i in range(5 * LEAF_SIZE))
+        rope = Rope.from_str(text)
+        for position in (0, 1, LEAF_SIZE - 1, LEAF_SIZE, len(text) - 1):
+            self.assertEqual(rope.char_at(position), text[position])
+        self.assertEqual(rope.char_at(len(text)), "")
+        self.assertEqual(rope.slice(LEAF_SIZE - 5, 3 * LEAF_SIZE + 5), text[LEAF_SIZE - 5:3 * LEAF_SIZE + 5])
+        self.assertEqual(rope.slice(10, 10), "")
+
+    def test_split_concat(self):
+        """Test splitting a rope and joining the parts."""
+        text = "abc" * (2 * LEAF_SIZE)
+        rope = Rope.from_str(text)
+        for position in (0, 1, LEAF_SIZE, len(text) // 2, len(text)):
+            left, right = rope.split(position)
+            self.assertEqual(left.to_str(), text[:position])
+            self.assertEqual(right.to_str(), text[position:])
+            self.assertEqual(left.concat(right).to_str(), text)
+
+    def test_random_edits(self):
+        """Test random edits against the equivalent string operations."""
+        rng = random.Random(42)
+        text = "".join(rng.choice("ab c\n") for _ in range(4 * LEAF_SIZE))
+        rope = Rope.from_str(text)
+
+        for _ in range(500):
+            start = rng.randrange(len(text) + 1)
+            end = rng.randrange(start, min(len(text), start + rng.choice((0, 1, 10, 2 * LEAF_SIZE))) + 1)
+            insert = "y" * rng.choice((0, 1, 3, 3 * LEAF_SIZE))
+            rope = rope.splice(start, end, insert)
+            text = text[:start] + insert + text[end:]
+            self.assertEqual(len(rope), len(text))
+            check_balanced(rope)
+
+        self.assertEqual(rope.to_str(), text)
+
+    def test_typing_does_not_fragment(self):
+        """Test that a run of single character inserts keeps leaves large."""
+        rope = Rope.from_str("x" * (4 * LEAF_SIZE))
+        for i in range(2 * LEAF_SIZE):
+            rope = rope.insert(LEAF_SIZE + i, "y")
+        self.assertLessEqual(check_balanced(rope), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -47,6 +47,14 @@ class TestTaskNoteEnv(unittest.TestCase):
         self.assertTrue(tasknote_dir.exists())
         self.assertTrue(tasknote_dir.is_dir())
 
+    def test_mode(self):
+        """Test mode is None before and LOCAL after initializing in LOCAL mode."""
+        env = TaskNoteEnv(self.test_dir)
+        self.assertIsNone(env.mode)
+        
+        env.tasknote_init(mode="LOCAL")
+        self.assertEqual(env.mode, "LOCAL")
+
     def test_init_git_repo(self):
         """Test initialization with a git repository."""
         # Create a git repository in the test directory